@@ -68,7 +68,7 @@ os.environ["UNICORN_SIM_MODEL"] = args.model
 os.environ["UNICORN_SIM_PIXEL_SIZE"] = str(args.pixel_size)
 
 # Import the simulation hardware layer
-from sim.hardware_sim import graphics, gu, set_brightness, WIDTH, HEIGHT, MODEL
+from sim.hardware_sim import graphics, gu, set_brightness, WIDTH, HEIGHT, MODEL, BLACK_PEN, RED_PEN
 
 # Patch uw.hardware to point to our sim hardware
 import uw
@@ -80,7 +80,7 @@ from uw.logger import setup_logging, log
 from uw.state import state
 from uw.mqtt_service import MQTTService
 
-from uw.animation_service import run_random_animation, run_named_animation, get_animation_list
+from uw.animation_service import run_random_animation, run_named_animation, get_animation_list, ANIMATION_SET
 from uw.background_tasks import debug_monitor
 from uw.transitions import melt_off, countdown
 
@@ -94,7 +94,7 @@ if args.animation:
         sys.exit(1)
     
     # Override the animation sequence in config
-    config._config["general"]["sequence"] = [args.animation]
+    config.set("general", "sequence", [args.animation])
 
 import uasyncio
 
@@ -104,7 +104,7 @@ state.wifi_connected = True
 async def main():
     setup_logging(config.get("general", "debug", False))
     set_brightness(config.get("general", "brightness", 0.75))
-    graphics.set_pen(graphics.create_pen(0, 0, 0))
+    graphics.set_pen(BLACK_PEN)
     graphics.clear()
     gu.update(graphics)
 
@@ -123,8 +123,10 @@ async def main():
             state.mqtt_service = None
     else:
         log("MQTT disabled.", "INFO")
-    sequence = list(config.get("general", "sequence", ["*"]))
-    animation_list = get_animation_list()
+    sequence = tuple(config.get("general", "sequence", ["*"]))
+    sequence_index = 0
+    # Use command line duration if provided, otherwise use config
+    duration = args.duration if args.duration is not None else config.get("general", "max_runtime_s", 120)
     
     iteration_count = 0
     max_iterations = args.max_iterations
@@ -132,19 +134,15 @@ async def main():
     while True:
         if not state.display_on:
             await melt_off()
-            while not state.display_on:
-                await uasyncio.sleep(0.2)
+            await state.display_on_event.wait()
             await countdown()
 
-        job = sequence.pop(0)
-        sequence.append(job)
+        job = sequence[sequence_index]
+        sequence_index = (sequence_index + 1) % len(sequence)
 
-        # Use command line duration if provided, otherwise use config
-        duration = args.duration if args.duration is not None else config.get("general", "max_runtime_s", 120)
-        
         if job == "*" or job == "animation":
             await run_random_animation(duration)
-        elif job in animation_list:
+        elif job in ANIMATION_SET:
             success = await run_named_animation(job, duration)
             # If specific animation was requested and failed, exit
             if args.animation and not success:
@@ -174,7 +172,7 @@ if __name__ == "__main__":
     except Exception as e:
         log(f"Fatal error: {e}", "ERROR")
         try:
-            graphics.set_pen(graphics.create_pen(255, 0, 0))
+            graphics.set_pen(RED_PEN)
             graphics.clear()
             gu.update(graphics)
         except Exception:
@@ -135,5 +135,9 @@ class GUISim:
 graphics = GraphicsSim()
 gu = GUISim(graphics)
 
+# shared pens for clearing and the crash screen, created once at import
+BLACK_PEN = graphics.create_pen(0, 0, 0)
+RED_PEN = graphics.create_pen(255, 0, 0)
+
 def set_brightness(level):
     gu.set_brightness(level)
\ No newline at end of file
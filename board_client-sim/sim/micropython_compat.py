@@ -62,6 +62,14 @@ if not hasattr(sys, "_uw_sim_compat_setup"):
         @staticmethod
         def const(value):
             return value
+        @staticmethod
+        def viper(func):
+            return func
     sys.modules['micropython'] = Micropython()
 
+    # Viper pointer casts (ptr32 etc.) appear in annotations; arrays index the same way
+    import builtins
+    for name in ('ptr', 'ptr8', 'ptr16', 'ptr32'):
+        setattr(builtins, name, lambda obj: obj)
+
     sys._uw_sim_compat_setup = True
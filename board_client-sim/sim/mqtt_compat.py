@@ -142,6 +142,9 @@ class MQTTServiceSim:
             print(f"✗ Failed to publish status: {e}")
             return False
 
+    def publish_animation(self, animation_name):
+        return self.publish_status({"animation": animation_name})
+
     def _should_attempt_connection(self):
         now = time.time()
         if now - self.last_connection_attempt < 5:
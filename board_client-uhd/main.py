@@ -25,8 +25,9 @@ from uhd.memory_debug import print_memory_summary, find_large_objects, debug_str
 print("Memory monitor imported")
 
 # Import animation service - this should work mostly unchanged
-from uw.animation_service import get_animation_list
+from uw.animation_service import ANIMATION_LIST, ANIMATION_SET
 from uw.transitions import melt_off, countdown
+from animations.text_scroller import run as run_text_scroller
 
 # Emergency memory threshold (MB)
 EMERGENCY_MEMORY_THRESHOLD = 100  # Lower threshold for streaming
@@ -188,8 +189,6 @@ async def handle_text_interrupt():
             print(f"[Text] Displaying: {state.text_message}")
             memory_before = memory_monitor.check_memory()
             
-            from animations.text_scroller import run as run_text_scroller
-            
             # Run text with timeout too
             try:
                 await uasyncio.wait_for(
@@ -236,12 +235,11 @@ async def main():
     else:
         log("MQTT disabled.", "INFO")
     
-    # Get animations
-    animation_list = get_animation_list()
-    sequence = list(config.get("general", "sequence", ["*"]))
+    sequence = tuple(config.get("general", "sequence", ["*"]))
+    sequence_index = 0
     
-    log(f"Starting main loop with {len(animation_list)} animations", "INFO")
-    print(f"Animation list: {animation_list}")
+    log(f"Starting main loop with {len(ANIMATION_LIST)} animations", "INFO")
+    print(f"Animation list: {ANIMATION_LIST}")
     
     # Main loop
     loop_iteration = 0
@@ -283,8 +281,8 @@ async def main():
             continue
         
         # Run next in sequence
-        job = sequence.pop(0)
-        sequence.append(job)  # Rotate
+        job = sequence[sequence_index]
+        sequence_index = (sequence_index + 1) % len(sequence)
         
         max_runtime = config.get("general", "max_runtime_s", 30)
         print(f"[Main] Next job: {job} (max runtime: {max_runtime}s)")
@@ -294,15 +292,15 @@ async def main():
             await run_animation_with_timeout(animation, max_runtime)
         elif job == "*":
             import random
-            animation = random.choice(animation_list)
+            animation = random.choice(ANIMATION_LIST)
             print(f"[Main] Random animation selected: {animation}")
             await run_animation_with_timeout(animation, max_runtime)
-        elif job in animation_list:
+        elif job in ANIMATION_SET:
             print(f"[Main] Running specific animation: {job}")
             await run_animation_with_timeout(job, max_runtime)
         else:
             log(f"Unknown sequence job: {job}", "WARN")
-            print(f"[Main] Unknown job: {job}, available: {animation_list}")
+            print(f"[Main] Unknown job: {job}, available: {ANIMATION_LIST}")
         
 if __name__ == "__main__":
     try:
@@ -70,9 +70,19 @@ def setup_micropython_compat():
         def const(value):
             """micropython.const() - just return value on Pi"""
             return value
+        
+        @staticmethod
+        def viper(func):
+            """@micropython.viper decorator - no-op on Pi"""
+            return func
     
     sys.modules['micropython'] = Micropython()
     
+    # Viper pointer casts (ptr32 etc.) appear in annotations; arrays index the same way
+    import builtins
+    for name in ('ptr', 'ptr8', 'ptr16', 'ptr32'):
+        setattr(builtins, name, lambda obj: obj)
+    
     # Mark as setup
     setup_micropython_compat._setup_done = True
     print("MicroPython compatibility layer loaded")
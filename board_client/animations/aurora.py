@@ -107,7 +107,8 @@ async def run(graphics, gu, state, interrupt_event):
     # Pre-allocate all palette pens (Item 9)
     global PALETTE_PENS
     if not PALETTE_PENS:
-        PALETTE_PENS = [graphics.create_pen(r, g, b) for r, g, b in PALETTE]
+        PALETTE_PENS = [graphics.create_pen(PALETTE[i * 3], PALETTE[i * 3 + 1], PALETTE[i * 3 + 2])
+                        for i in range(PALETTE_SIZE)]
 
     # Fixed-point smoothing buffer using int16 (Item 8)
     # Scale factor: 256 for 8.8 fixed point arithmetic
@@ -2,68 +2,281 @@ import uasyncio
 import utime
 import random
 import micropython
+import array
+# Bare const() so the compiler inlines the particle field offsets into the
+# viper kernel; micropython.const() names load as objects there
+from micropython import const
 
-from animations.utils import hsv_to_rgb, fast_sin, fast_cos
+from animations.utils import hsv_to_rgb, SIN_LUT_Q15
 from uw.hardware import WIDTH, HEIGHT, MODEL
 from uw.logger import log
 
-# Pre-calculated 3x3 digit patterns (same as original)
-DIGITS_3x3 = [
-    ["###", "# #", "###"],  # 0
-    [" # ", " # ", " # "],  # 1
-    ["###", " # ", "###"],  # 2
-    ["# #", " ##", "# #"],  # 3
-    ["# #", "###", "  #"],  # 4
-    ["###", " # ", "###"],  # 5
-    [" ##", "#  ", "## "],  # 6
-    ["###", "  #", "  #"],  # 7
-    ["# #", "# #", "# #"],  # 8
-    ["###", "#  ", "#  "],  # 9
-]
-
-class ExplosionParticle:
-    """Particle for fireworks-style explosion"""
-    def __init__(self, x, y, vx, vy, color, life):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.life = life
-        self.age = 0
-        
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.08  # Gravity
-        self.vx *= 0.98  # Air resistance
-        self.age += 1
-        return self.age < self.life
+# Pre-calculated 3x3 countdown digits: bit (row * 3 + col) is set for a lit
+# cell, so each binary literal reads bottom row first, right to left
+DIGIT_BITS = array.array('H', [
+    0b111101111,  # 0: ### / # # / ###
+    0b010010010,  # 1:  #  /  #  /  #
+    0b111010111,  # 2: ### /  #  / ###
+    0b101110101,  # 3: # # /  ## / # #
+    0b100111101,  # 4: # # / ### /   #
+    0b111010111,  # 5: ### /  #  / ###
+    0b011001110,  # 6:  ## / #   / ##
+    0b100100111,  # 7: ### /   # /   #
+    0b101101101,  # 8: # # / # # / # #
+    0b001001111,  # 9: ### / #   / #
+])
+
+# Frame budget; scene motion is per frame, so a steady period keeps speed steady
+_FRAME_MS = const(20)
+
+# Per-frame DEBUG logging; when 0 the compiler drops the calls and their f-strings
+_DEBUG = const(0)
+
+# Explosion particles live in one array('i') laid out field by field
+# (struct of arrays). Positions and velocities are Q8 fixed point. After the
+# fields comes the draw list update_particles fills for the frame: x, y, pen
+# index and sparkle pen index (-1 for none) per visible particle
+PARTICLE_COLORS = (
+    (255, 255, 255),  # White core
+    (255, 220, 0),    # Yellow
+    (255, 150, 0),    # Orange
+    (255, 50, 50),    # Red
+    (255, 100, 200),  # Pink
+)
+_FADE_LEVELS = const(16)
+_PARTICLE_MAX = const(64)
+_P_X = const(0)
+_P_Y = const(64)
+_P_VX = const(128)
+_P_VY = const(192)
+_P_AGE = const(256)
+_P_LIFE = const(320)
+_P_COLOR = const(384)  # First pen of the colour's fade run
+_P_DRAW = const(448)
+_P_DRAWN = const(704)  # Number of draw list entries
+_P_SIZE = const(705)
+# Q16 reciprocals of particle lifetimes (25-45 frames), rounded up so the
+# fade level multiply matches an exact floor divide
+_LIFE_MAX = const(45)
+_LIFE_RECIP = array.array('i', [0] + [-(-65536 // life) for life in range(1, _LIFE_MAX + 1)])
+
+@micropython.viper
+def update_particles(p: ptr32, n: int, width: int, height: int) -> int:
+    # Advance n live particles, compact the survivors to the front and list
+    # the on-screen ones with their faded pens. Returns the new count
+    recip = ptr32(_LIFE_RECIP)
+    w = 0
+    d = _P_DRAW
+    i = 0
+    while i < n:
+        age = p[_P_AGE + i] + 1
+        life = p[_P_LIFE + i]
+        if age < life:
+            vx = p[_P_VX + i]
+            vy = p[_P_VY + i]
+            x = p[_P_X + i] + vx
+            y = p[_P_Y + i] + vy
+            pens = p[_P_COLOR + i]
+            p[_P_X + w] = x
+            p[_P_Y + w] = y
+            p[_P_VX + w] = (vx * 251) >> 8  # Air resistance (0.98)
+            p[_P_VY + w] = vy + 20  # Gravity (0.08)
+            p[_P_AGE + w] = age
+            p[_P_LIFE + w] = life
+            p[_P_COLOR + w] = pens
+            w += 1
+            x >>= 8
+            y >>= 8
+            if 0 <= x and x < width and 0 <= y and y < height:
+                # Fade with age in 1/16 steps; sparkles only while over half
+                # bright, at 0.4 of the faded colour
+                level = (((life - age) << 4) * recip[life]) >> 16
+                p[d] = x
+                p[d + 1] = y
+                p[d + 2] = pens + level
+                if level > 8:
+                    p[d + 3] = pens + ((level * level * 205) >> 13)  # / 40
+                else:
+                    p[d + 3] = -1
+                d += 4
+        i += 1
+    p[_P_DRAWN] = (d - _P_DRAW) >> 2
+    return w
 
 @micropython.native
 def draw_small_digit(graphics, digit, x, y, color_pen):
     if 0 <= digit <= 9:
-        pattern = DIGITS_3x3[digit]
         graphics.set_pen(color_pen)
-        for row in range(3):
-            line = pattern[row]
-            py = y + row
-            if 0 <= py < HEIGHT:
-                for col in range(3):
-                    if line[col] == "#":
-                        px = x + col
-                        if 0 <= px < WIDTH:
-                            graphics.pixel(px, py)
+        bits = DIGIT_BITS[digit]
+        clipped = not (0 <= x and x + 3 <= WIDTH and 0 <= y and y + 3 <= HEIGHT)
+        dx = 0
+        dy = 0
+        while bits:
+            if bits & 1:
+                px = x + dx
+                py = y + dy
+                if not clipped or (0 <= px < WIDTH and 0 <= py < HEIGHT):
+                    graphics.pixel(px, py)
+            bits >>= 1
+            dx += 1
+            if dx == 3:
+                dx = 0
+                dy += 1
+
+@micropython.native
+def draw_sparkle(graphics, x, y):
+    # 4-neighbour sparkle around an explosion particle, in the current pen
+    if y + 1 < HEIGHT:
+        graphics.pixel(x, y + 1)
+    if y > 0:
+        graphics.pixel(x, y - 1)
+    if x + 1 < WIDTH:
+        graphics.pixel(x + 1, y)
+    if x > 0:
+        graphics.pixel(x - 1, y)
 
 @micropython.native
 def draw_countdown(graphics, value, color_pen, y=1):
-    num_str = f"{value:03d}"
     total_w = 11
     start_x = (WIDTH - total_w) >> 1
-    for i in range(3):
-        digit = int(num_str[i])
-        x_pos = start_x + (i << 2)
-        draw_small_digit(graphics, digit, x_pos, y, color_pen)
+    draw_small_digit(graphics, (value // 100) % 10, start_x, y, color_pen)
+    draw_small_digit(graphics, (value // 10) % 10, start_x + 4, y, color_pen)
+    draw_small_digit(graphics, value % 10, start_x + 8, y, color_pen)
+
+# Flight pose and projection run in fixed point: pose values are Q12
+# (4096 == 1.0), world coordinates Q8 (256 == 1.0), angles index the
+# 1024-step SIN_LUT_Q15 table
+_LUT_PER_S_Q10 = const(167)  # sin_lut steps per second (1024 / (2 * pi)), Q10 per ms
+_Z_NEAR = const(26)  # 0.1 in Q8
+# Pose array slots after the 11 set_pose coefficients: point depth and vanishing point
+_M_Z = const(11)
+_M_VX = const(12)
+_M_VY = const(13)
+
+# Q12 unit vectors for the 24 vertices of an explosion ring (15 degree steps)
+_RING_COS = array.array('i', [SIN_LUT_Q15[((k << 10) // 24 + 256) & 1023] >> 3 for k in range(24)])
+_RING_SIN = array.array('i', [SIN_LUT_Q15[(k << 10) // 24] >> 3 for k in range(24)])
+
+@micropython.native
+def set_pose(m, k, cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y):
+    # Fold roll, pitch, altitude, shake and the focal constant k into one
+    # affine map so each projected point is a handful of multiply-adds:
+    #   X = m0*x + m1*y + m2        (shared by floor and wall points)
+    #   Y = m3*x + m4*y + m5        (floor)    Y = m9*y + m5     (wall)
+    #   Z = z + m6*x + m7*y + m8    (floor)    Z = z + m10*y + m8 (wall)
+    # Inputs are Q12. With Q8 points, X and Y come out Q20 and Z (after >> 12)
+    # Q8, so a screen offset is X // (Z << 12)
+    k_cos_pitch = (k * cos_pitch) >> 12
+    m[0] = (k * cos_roll) >> 12
+    m[1] = -((k * sin_roll) >> 12)
+    m[2] = (k * shake_x) >> 4
+    m[3] = (k_cos_pitch * sin_roll) >> 12
+    m[4] = (k_cos_pitch * cos_roll) >> 12
+    m[5] = ((k * shake_y) >> 4) - ((k_cos_pitch * altitude) >> 4)
+    m[6] = (sin_pitch * sin_roll) >> 12
+    m[7] = (sin_pitch * cos_roll) >> 12
+    m[8] = -((altitude * sin_pitch) >> 4)
+    m[9] = k_cos_pitch
+    m[10] = sin_pitch
+
+@micropython.native
+def project_flight(out, m, x, y):
+    # Floor-mode projection of (x, y, m[_M_Z]) into out[0], out[1]. Depth and
+    # vanishing point ride in the pose array so the call stays at 4 arguments.
+    # Native rather than viper so the depth divide stays out of viper code
+    z = m[_M_Z] + ((m[6] * x + m[7] * y + m[8]) >> 12)
+    if z < _Z_NEAR:
+        z = _Z_NEAR
+    z <<= 12
+    out[0] = m[_M_VX] + (m[0] * x + m[1] * y + m[2]) // z
+    out[1] = m[_M_VY] - (m[3] * x + m[4] * y + m[5]) // z
+
+@micropython.native
+def project_flight_wall(out, m, x, y):
+    # Walls stay upright: roll only skews x, y is untouched
+    z = m[_M_Z] + ((m[10] * y + m[8]) >> 12)
+    if z < _Z_NEAR:
+        z = _Z_NEAR
+    z <<= 12
+    out[0] = m[_M_VX] + (m[0] * x + m[1] * y + m[2]) // z
+    out[1] = m[_M_VY] - (m[9] * y + m[5]) // z
+
+@micropython.native
+def build_trench_lines(out, m, zt, geo):
+    # Project every trench grid point for the frame in one pass. geo holds
+    # segments, scroll offset, trench width, trench height, outer rim width,
+    # vanishing x and vanishing y. Each segment writes 16 int16s to out as x,y
+    # pairs: floor left/right, wall foot left/right, wall top left/right and
+    # outer rim left/right. Points sharing a depth share one divide per axis.
+    # Native rather than viper so the per-depth divides stay out of viper code
+    n = geo[0]
+    off = geo[1]
+    w = geo[2]
+    h = geo[3]
+    ow = geo[4]
+    vx = geo[5]
+    vy = geo[6]
+    # Screen numerators and depth shifts only depend on the pose, not z
+    m2 = m[2]
+    m5 = m[5]
+    m8 = m[8]
+    xw = m[0] * w
+    xo = m[0] * ow
+    xh = m[1] * h + m2
+    x_floor_l = m2 - xw
+    x_floor_r = m2 + xw
+    x_top_l = xh - xw
+    x_top_r = xh + xw
+    x_outer_l = xh - xo
+    x_outer_r = xh + xo
+    y_floor_l = m5 - m[3] * w
+    y_floor_r = m5 + m[3] * w
+    y_top = m[9] * h + m5
+    dz_floor_l = (m8 - m[6] * w) >> 12
+    dz_floor_r = (m8 + m[6] * w) >> 12
+    dz_foot = m8 >> 12
+    dz_top = (m[10] * h + m8) >> 12
+    near = _Z_NEAR
+    i = 0
+    o = 0
+    while i < n:
+        z = zt[i] - off
+        zl = z + dz_floor_l
+        if zl < near:
+            zl = near
+        zl <<= 12
+        zr = z + dz_floor_r
+        if zr < near:
+            zr = near
+        zr <<= 12
+        zf = z + dz_foot
+        if zf < near:
+            zf = near
+        zf <<= 12
+        zh = z + dz_top
+        if zh < near:
+            zh = near
+        zh <<= 12
+        out[o] = vx + x_floor_l // zl
+        out[o + 1] = vy - y_floor_l // zl
+        out[o + 2] = vx + x_floor_r // zr
+        out[o + 3] = vy - y_floor_r // zr
+        y = vy - m5 // zf
+        out[o + 4] = vx + x_floor_l // zf
+        out[o + 5] = y
+        out[o + 6] = vx + x_floor_r // zf
+        out[o + 7] = y
+        y = vy - y_top // zh
+        out[o + 8] = vx + x_top_l // zh
+        out[o + 9] = y
+        out[o + 10] = vx + x_top_r // zh
+        out[o + 11] = y
+        out[o + 12] = vx + x_outer_l // zh
+        out[o + 13] = y
+        out[o + 14] = vx + x_outer_r // zh
+        out[o + 15] = y
+        i += 1
+        o += 16
 
 async def run(graphics, gu, state, interrupt_event):
     log("Trench run animation started", "INFO")
@@ -74,27 +287,41 @@ async def run(graphics, gu, state, interrupt_event):
     EXPLOSION_TIME_SECONDS = 17  # 15-20s for explosion sequence (17s gives good middle ground)
 
     SEGMENTS = 14 if MODEL == "cosmic" else 18
-    SPEED = 0.25
+    # World distances below are Q8 fixed point (256 == 1.0)
+    SPEED = 64  # 0.25
 
     vanishing_x = WIDTH >> 1
     vanishing_y = 5 + ((HEIGHT - 5) >> 1)
 
     if (MODEL == "galactic") or (WIDTH > HEIGHT * 2):
-        trench_width = 2.5  # Narrower (was 3.0)
+        trench_width = 640  # 2.5, narrower (was 3.0)
     else:
-        trench_width = 1.2  # Narrower (was 1.5)
-    trench_height = 2.0  # Taller (was 1.5)
-    grid_spacing = 1.2
+        trench_width = 307  # 1.2, narrower (was 1.5)
+    trench_height = 512  # 2.0, taller (was 1.5)
+    grid_spacing = 307  # 1.2
+    max_z = SEGMENTS * grid_spacing
+
+    # Segment depths never change; only the scroll offset does
+    Z_TABLE = array.array('i', [128 + i * grid_spacing for i in range(SEGMENTS)])
 
     black_pen = graphics.create_pen(0, 0, 0)
     red_pen = graphics.create_pen(255, 0, 0)
     blue_pen = graphics.create_pen(0, 180, 255)
-    white_pen = graphics.create_pen(255, 255, 255)
-    explosion_orange_pen = graphics.create_pen(255, 150, 0)
-    explosion_yellow_pen = graphics.create_pen(255, 220, 0)
-    explosion_orange_pen = graphics.create_pen(255, 150, 0)
-    explosion_yellow_pen = graphics.create_pen(255, 220, 0)
-
+    # Explosion flash alternates white and yellow every 1/30s
+    flash_pens = (graphics.create_pen(255, 255, 255), graphics.create_pen(255, 220, 0))
+
+    # Tower pens for 16 hues x 8 brightness steps (index hue << 3 | step),
+    # laser pens for the same hues at full brightness
+    tower_pens = [graphics.create_pen(*hsv_to_rgb(h / 16.0, 0.85, v / 8.0))
+                  for h in range(16) for v in range(1, 9)]
+    laser_pens = [graphics.create_pen(*hsv_to_rgb(h / 16.0, 1.0, 1.0)) for h in range(16)]
+    # Tower brightness step (0-7) by depth, falling off with the square of
+    # distance; indexed by z >> 6, a quarter world unit per entry
+    max_z_sq = max_z * max_z
+    tower_fog = bytes([min(7, ((max(0, max_z - (z << 6)) ** 2) << 3) // max_z_sq)
+                       for z in range(((128 + max_z) >> 6) + 1)])
+
+    # One pen per segment, so the draw loops index these directly by segment
     brightness_pens = []
     edge_pens = []
     outline_pens = []
@@ -116,7 +343,15 @@ async def run(graphics, gu, state, interrupt_event):
     towers = []
     explosion_active = False
     explosion_start = 0
-    explosion_particles = []
+    explosion_setup_pending = False
+    particles = array.array('i', [0] * _P_SIZE)
+    particle_count = 0
+    # One pen per burst colour and fade level, so particles never create pens
+    particle_pens = [
+        graphics.create_pen((r * level) >> 4, (g * level) >> 4, (b * level) >> 4)
+        for r, g, b in PARTICLE_COLORS
+        for level in range(_FADE_LEVELS + 1)
+    ]
     missiles = []
     lasers = []
     explosion_circles = []  # For expanding circle effects
@@ -129,6 +364,7 @@ async def run(graphics, gu, state, interrupt_event):
     
     # Dynamic frame rate measurement - wait 2 seconds to measure actual performance
     frame_measurement_time = 2.0  # seconds to measure frame rate
+    frame_measurement_ms = int(frame_measurement_time * 1000)
     frame_count = 0
     frame_rate_measured = False
     measured_fps = 50.0  # default assumption
@@ -145,29 +381,31 @@ async def run(graphics, gu, state, interrupt_event):
     actual_runtime = max(MAX_RUNTIME, MIN_RUNTIME_BEFORE_DESTRUCTION)
     log(f"Trench run: max_runtime={MAX_RUNTIME}s, using actual_runtime={actual_runtime}s", "INFO")
 
-    @micropython.native
-    def project_flight(x, y, z, cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y, wall_mode=False):
-        if wall_mode:
-            x_rot = x * cos_roll - y * sin_roll
-            y_rot = y
-        else:
-            x_rot = x * cos_roll - y * sin_roll
-            y_rot = x * sin_roll + y * cos_roll
-        y_with_altitude = y_rot - altitude
-        y_pitched = y_with_altitude * cos_pitch
-        z_pitched = z + y_with_altitude * sin_pitch
-        z_final = max(0.1, z_pitched)
-        scale = (HEIGHT * 1.1) / (z_final * trench_height)
-        screen_x = vanishing_x + int((x_rot + shake_x) * scale)
-        screen_y = vanishing_y - int((y_pitched + shake_y) * scale)
-        return screen_x, screen_y
-
-    current_offset = 0.0
+    # Projected points are written into start_pt/end_pt rather than returned
+    # as a tuple, so the hot path allocates nothing per call
+    start_pt = array.array('i', [0, 0])
+    end_pt = array.array('i', [0, 0])
+    sin_lut = SIN_LUT_Q15
+    # Grid endpoints for build_trench_lines as int16 x,y pairs; geo[1] is the scroll offset
+    lines = array.array('h', [0] * (SEGMENTS * 16))
+    last_segment = SEGMENTS - 1
+    outer_landscape_width = (trench_width * 461) >> 8  # 1.8x
+    geo = array.array('i', [SEGMENTS, 0, trench_width, trench_height,
+                            outer_landscape_width, vanishing_x, vanishing_y])
+
+    # Per-frame pose matrices (see set_pose); the missile is drawn without camera shake.
+    # k_focal is HEIGHT * 1.1 / trench_height in Q12 (the extra 256 undoes Q8)
+    k_focal = int(HEIGHT * 1.1 * 4096 * 256 / trench_height)
+    pose = array.array('i', [0] * 11 + [0, vanishing_x, vanishing_y])
+    steady_pose = array.array('i', [0] * 11 + [0, vanishing_x, vanishing_y])
+
+    current_offset = 0
     elapsed = 0.0
 
     while not interrupt_event.is_set():
         current_time = utime.ticks_ms()
-        elapsed = (utime.ticks_diff(current_time, start_time)) * 0.001
+        elapsed_ms = utime.ticks_diff(current_time, start_time)
+        elapsed = elapsed_ms * 0.001
 
         # Frame rate measurement phase
         if not frame_rate_measured:
@@ -184,44 +422,21 @@ async def run(graphics, gu, state, interrupt_event):
                 end_interval = 0.1     # End fast for maximum tension
                 acceleration_power = 2.5  # Same as used in countdown logic
                 
-                # Calculate exact countdown_start that will consume the available time
-                # For our curve: interval = start * (1 - progress^2.5) + end * progress^2.5
-                # Total time = sum of all intervals from progress 0 to 1
-                # We need to find N such that sum equals total_countdown_time
-                
-                def calculate_total_time(N):
-                    """Calculate total time for N countdown steps with acceleration curve"""
-                    total = 0.0
-                    for i in range(N):
-                        progress = (N - i) / N  # From 1.0 at start to 0.0 at end
-                        acceleration_curve = (1.0 - progress) ** acceleration_power
-                        interval = start_interval * (1.0 - acceleration_curve) + end_interval * acceleration_curve
-                        total += interval
-                    return total
-                
-                # Binary search to find the right countdown_start
-                low, high = 50, 999
-                countdown_start = 200  # Starting guess
-                for _ in range(20):  # 20 iterations should be enough for precision
-                    estimated_time = calculate_total_time(countdown_start)
-                    if abs(estimated_time - total_countdown_time) < 1.0:  # Within 1 second
-                        break
-                    elif estimated_time > total_countdown_time:
-                        high = countdown_start
-                        countdown_start = (low + countdown_start) // 2
-                    else:
-                        low = countdown_start
-                        countdown_start = (countdown_start + high) // 2
+                # Mean interval over the curve: the integral of
+                # start * (1 - p^k) + end * p^k for p in [0, 1] is start + (end - start) / (k + 1),
+                # so countdown_start is just the available time over that mean
+                average_interval = start_interval + (end_interval - start_interval) / (acceleration_power + 1.0)
+                countdown_start = max(50, min(999, int(total_countdown_time / average_interval + 0.5)))
                 
                 # Verify our countdown start makes sense
                 if countdown_start < 100:
                     # Very short time - use minimum countdown but adjust intervals
                     countdown_start = 100
                     # Scale intervals to fit available time
-                    average_interval = (start_interval + end_interval) / 2.0
                     scale_factor = (total_countdown_time / countdown_start) / average_interval
                     start_interval *= scale_factor
                     end_interval *= scale_factor
+                    average_interval *= scale_factor
                     log(f"Short runtime - scaled intervals: {start_interval:.2f}s → {end_interval:.2f}s", "INFO")
                 
                 countdown = countdown_start
@@ -232,7 +447,7 @@ async def run(graphics, gu, state, interrupt_event):
                 last_countdown_update = current_time
                 countdown_phase_started = True
                 
-                final_estimated_time = calculate_total_time(countdown_start)
+                final_estimated_time = countdown_start * average_interval
                 log(f"Frame rate: {measured_fps:.1f} FPS, countdown: {countdown_start} ({final_estimated_time:.1f}s/{total_countdown_time:.1f}s) {start_interval:.1f}s→{end_interval:.1f}s", "INFO")
 
         # Calculate urgency factor based on countdown progress (if countdown has started)
@@ -241,173 +456,173 @@ async def run(graphics, gu, state, interrupt_event):
         else:
             urgency_factor = 0.3  # Low urgency during frame measurement phase
 
-        # Enhanced movement for better speed sensation
-        base_roll = fast_sin(elapsed * 1.8) * 0.12 + fast_sin(elapsed * 0.7) * 0.06  # Increased frequency and amplitude
-        banking = fast_sin(elapsed * 1.0) * 0.25 * urgency_factor  # Increased banking
-        pitch_base = fast_sin(elapsed * 1.3) * 0.18 * urgency_factor  # Enhanced pitch movement
-        pitch_dodge = fast_sin(elapsed * 3.2) * 0.10 * urgency_factor  # Faster, more pronounced dodging
+        # Enhanced movement for better speed sensation. Angles and altitude are
+        # Q12 (4096 == 1.0). t is elapsed time as a Q8 sin_lut index, so a
+        # frequency of f/16 radians per second indexes at (t * f) >> 12 without
+        # allocating floats; the mask keeps those products in small ints and
+        # wraps on a whole number of turns. Table values are Q15, so products
+        # shift down by 15 rather than 12
+        u = int(urgency_factor * 4096)
+        t = ((elapsed_ms * _LUT_PER_S_Q10) >> 2) & 0x3FFFFF
+        base_roll = (sin_lut[((t * 29) >> 12) & 1023] * 492 + sin_lut[((t * 11) >> 12) & 1023] * 246) >> 15  # 0.12 and 0.06
+        banking = (sin_lut[(t >> 8) & 1023] * u) >> 17  # 0.25, increased banking
+        pitch_base = (((sin_lut[((t * 21) >> 12) & 1023] * 737) >> 15) * u) >> 12  # 0.18, enhanced pitch movement
+        pitch_dodge = (((sin_lut[((t * 51) >> 12) & 1023] * 410) >> 15) * u) >> 12  # 0.10, faster dodging
         
         # Special swooping descent during frame measurement phase
         if not frame_rate_measured:
             # Cinematic swoop down into trench during countdown calculation
-            swoop_progress = min(1.0, elapsed / frame_measurement_time)  # 0.0 to 1.0 over 2 seconds
-            # Start high above trench, swoop down smoothly
-            swoop_altitude = 3.0 * (1.0 - swoop_progress * swoop_progress)  # Quadratic descent for smooth swooping
-            altitude = max(0.4, swoop_altitude)  # End at normal flight altitude
+            swoop_progress = min(4096, (elapsed_ms << 12) // frame_measurement_ms)  # 0.0 to 1.0
+            # Start high above trench (3.0), quadratic descent for smooth swooping
+            swoop_altitude = 3 * (4096 - ((swoop_progress * swoop_progress) >> 12))
+            altitude = max(1638, swoop_altitude)  # End at normal flight altitude (0.4)
             
             # Banking approach - reduce banking as we get lower to avoid clipping
             # Only bank when high above the trench, level out as we descend
-            safe_banking_altitude = 1.5  # Only bank when above this altitude
+            safe_banking_altitude = 6144  # Only bank when above this altitude (1.5)
             if altitude > safe_banking_altitude:
-                # Banking turn during high altitude approach
-                bank_intensity = (altitude - safe_banking_altitude) / (3.0 - safe_banking_altitude)  # 1.0 when highest, 0.0 at safe altitude
-                bank_angle = fast_sin(swoop_progress * 3.14159) * -0.6 * bank_intensity  # Scale banking by altitude
+                # Banking turn during high altitude approach, 1.0 when highest, 0.0 at safe altitude
+                bank_intensity = ((altitude - safe_banking_altitude) << 12) // (12288 - safe_banking_altitude)
+                # sin(progress * pi) * -0.6, scaled by altitude
+                bank_angle = -((((sin_lut[swoop_progress >> 3] * 2458) >> 15) * bank_intensity) >> 12)
                 roll_angle = base_roll + bank_angle
             else:
                 # Level flight when close to trench walls
-                roll_angle = base_roll * 0.3  # Minimal rolling when low
+                roll_angle = (base_roll * 1229) >> 12  # Minimal rolling when low (0.3)
             
-            # Forward dive during swoop with leveling out
-            dive_angle = swoop_progress * (1.0 - swoop_progress) * -0.5  # Slightly less aggressive dive
+            # Forward dive during swoop with leveling out: progress * (1 - progress) * -0.5
+            dive_angle = -((swoop_progress * (4096 - swoop_progress)) >> 13)
             pitch_angle = pitch_base + pitch_dodge + dive_angle
         else:
             # Normal flight after swoop is complete with smooth transition
             normal_roll = base_roll + banking
             normal_pitch = pitch_base + pitch_dodge
-            normal_altitude_base = 0.4 + fast_sin(elapsed * 0.8) * 0.4  # More altitude variation
-            normal_altitude_evasive = fast_sin(elapsed * 2.5) * 0.6 * urgency_factor  # More dramatic evasive moves
-            normal_altitude = max(0.1, normal_altitude_base + abs(normal_altitude_evasive))
+            normal_altitude_base = 1638 + ((sin_lut[((t * 13) >> 12) & 1023] * 1638) >> 15)  # 0.4 +- 0.4
+            normal_altitude_evasive = (((sin_lut[((t * 40) >> 12) & 1023] * 2458) >> 15) * u) >> 12  # 0.6, evasive moves
+            normal_altitude = max(410, normal_altitude_base + abs(normal_altitude_evasive))
             
             # Smooth transition from swoop end values to normal flight
-            transition_time = 1.0  # 1 second transition period
-            transition_elapsed = elapsed - frame_measurement_time  # Time since swoop ended
-            if transition_elapsed < transition_time:
+            transition_ms = 1000  # 1 second transition period
+            transition_elapsed = elapsed_ms - frame_measurement_ms  # Time since swoop ended
+            if transition_elapsed < transition_ms:
                 # Blend from swoop end state to normal flight
-                blend_factor = transition_elapsed / transition_time
-                blend_factor = blend_factor * blend_factor  # Ease-in transition
+                blend_factor = (transition_elapsed << 12) // transition_ms
+                blend_factor = (blend_factor * blend_factor) >> 12  # Ease-in transition
                 
                 # Values at end of swoop (what we're transitioning from)
-                swoop_end_roll = base_roll * 0.3  # Last roll value from swoop
-                swoop_end_pitch = pitch_base + pitch_dodge + 0  # Last pitch (dive_angle was 0 at end)
-                swoop_end_altitude = 0.4  # End altitude of swoop
+                swoop_end_roll = (base_roll * 1229) >> 12  # Last roll value from swoop
+                swoop_end_altitude = 1638  # End altitude of swoop
                 
-                # Blend the values
-                roll_angle = swoop_end_roll * (1.0 - blend_factor) + normal_roll * blend_factor
-                pitch_angle = swoop_end_pitch * (1.0 - blend_factor) + normal_pitch * blend_factor
-                altitude = swoop_end_altitude * (1.0 - blend_factor) + normal_altitude * blend_factor
+                # Blend the values; the swoop ends with no dive, so pitch needs no blending
+                roll_angle = swoop_end_roll + (((normal_roll - swoop_end_roll) * blend_factor) >> 12)
+                pitch_angle = normal_pitch
+                altitude = swoop_end_altitude + (((normal_altitude - swoop_end_altitude) * blend_factor) >> 12)
             else:
                 # Full normal flight after transition period
                 roll_angle = normal_roll
                 pitch_angle = normal_pitch
                 altitude = normal_altitude
-        cos_roll = fast_cos(roll_angle)
-        sin_roll = fast_sin(roll_angle)
-        cos_pitch = fast_cos(pitch_angle)
-        sin_pitch = fast_sin(pitch_angle)
-        shake_intensity = 1.0 + urgency_factor * 2.5  # More intense shaking
-        shake_x = fast_sin(elapsed * 4.2) * 0.08 * shake_intensity  # Faster, more pronounced shake
-        shake_y = fast_sin(elapsed * 3.6) * 0.06 * shake_intensity
+        roll_angle = (roll_angle * 163) >> 12  # Q12 radians to sin_lut index
+        pitch_angle = (pitch_angle * 163) >> 12
+        cos_roll = sin_lut[(roll_angle + 256) & 1023] >> 3
+        sin_roll = sin_lut[roll_angle & 1023] >> 3
+        cos_pitch = sin_lut[(pitch_angle + 256) & 1023] >> 3
+        sin_pitch = sin_lut[pitch_angle & 1023] >> 3
+        shake_intensity = 4096 + ((u * 5) >> 1)  # More intense shaking (1.0 + urgency * 2.5)
+        shake_x = (((sin_lut[((t * 67) >> 12) & 1023] * 328) >> 15) * shake_intensity) >> 12  # 0.08, faster shake
+        shake_y = (((sin_lut[((t * 58) >> 12) & 1023] * 246) >> 15) * shake_intensity) >> 12  # 0.06
+        set_pose(pose, k_focal, cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y)
 
         graphics.set_pen(black_pen)
         graphics.clear()
 
         if not explosion_active:
             current_offset = (current_offset + SPEED) % grid_spacing
+            geo[1] = current_offset
+            build_trench_lines(lines, pose, Z_TABLE, geo)
 
-            # Draw floor grid lines
-            for i in range(SEGMENTS):
-                z = 0.5 + i * grid_spacing - (current_offset % grid_spacing)
-                pen_idx = min(i, len(brightness_pens) - 1)
-                px_left, py_left = project_flight(-trench_width, 0.0, z, cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y)
-                px_right, py_right = project_flight(trench_width, 0.0, z, cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y)
-                graphics.set_pen(brightness_pens[pen_idx])
-                graphics.line(px_left, py_left, px_right, py_right)
-                for side in [-trench_width, trench_width]:
-                    if MODEL == "cosmic" and i % 2 == 1:
-                        continue
-                    px0, py0 = project_flight(side, 0.0, z, cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y, wall_mode=True)
-                    px1, py1 = project_flight(side, trench_height, z, cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y, wall_mode=True)
-                    graphics.set_pen(brightness_pens[pen_idx])
-                    graphics.line(px0, py0, px1, py1)
-
-            # Draw top edges of the trench
-            for side in [-trench_width, trench_width]:
-                prev_px, prev_py = None, None
-                for i in range(SEGMENTS):
-                    z = 0.5 + i * grid_spacing - (current_offset % grid_spacing)
-                    px, py = project_flight(side, trench_height, z, cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y, wall_mode=True)
-                    if prev_px is not None:
-                        pen_idx = min(i, len(edge_pens) - 1)
-                        graphics.set_pen(edge_pens[pen_idx])
-                        graphics.line(prev_px, prev_py, px, py)
-                    prev_px, prev_py = px, py
-
-            # Draw outer landscape
-            outer_landscape_width = trench_width * 1.8
+            # Draw the trench in one pass over the segments: floor line, wall
+            # verticals, the top edges back to the previous segment, then the
+            # outer landscape
             for i in range(SEGMENTS):
-                z = 0.5 + i * grid_spacing - (current_offset % grid_spacing)
-                pen_idx = min(i, len(outline_pens) - 1)
-                for side in [-1, 1]:
-                    inner_x = side * trench_width
-                    inner_px, inner_py = project_flight(inner_x, trench_height, z, cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y, wall_mode=True)
-                    outer_x = side * outer_landscape_width
-                    outer_px, outer_py = project_flight(outer_x, trench_height, z, cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y, wall_mode=True)
-                    graphics.set_pen(outline_pens[pen_idx])
-                    graphics.line(inner_px, inner_py, outer_px, outer_py)
+                o = i << 4
+                graphics.set_pen(brightness_pens[i])
+                # Far segments collapse onto the same pixels; skip a floor line the
+                # next segment is about to draw over exactly
+                if (i == last_segment or lines[o] != lines[o + 16] or lines[o + 1] != lines[o + 17]
+                        or lines[o + 2] != lines[o + 18] or lines[o + 3] != lines[o + 19]):
+                    graphics.line(lines[o], lines[o + 1], lines[o + 2], lines[o + 3])
+                if MODEL != "cosmic" or i % 2 == 0:
+                    graphics.line(lines[o + 4], lines[o + 5], lines[o + 8], lines[o + 9])
+                    graphics.line(lines[o + 6], lines[o + 7], lines[o + 10], lines[o + 11])
+                if i:
+                    graphics.set_pen(edge_pens[i])
+                    graphics.line(lines[o - 8], lines[o - 7], lines[o + 8], lines[o + 9])
+                    graphics.line(lines[o - 6], lines[o - 5], lines[o + 10], lines[o + 11])
+                graphics.set_pen(outline_pens[i])
+                graphics.line(lines[o + 8], lines[o + 9], lines[o + 12], lines[o + 13])
+                graphics.line(lines[o + 10], lines[o + 11], lines[o + 14], lines[o + 15])
 
             # Tower spawning
             spawn_rate = 0.04 + urgency_factor * 0.02
             if random.random() < spawn_rate and len(towers) < 4:
                 side = -trench_width if random.random() < 0.5 else trench_width
                 tower = {
-                    "z": 0.5 + SEGMENTS * grid_spacing,
+                    "z": 128 + max_z,
                     "side": side,
-                    "height": random.uniform(0.5, 1.0) * trench_height,
-                    "hue": random.random(),
+                    "height": int(random.uniform(0.5, 1.0) * trench_height),
+                    "hue": int(random.random() * 16),  # tower_pens/laser_pens hue index
                 }
                 towers.append(tower)
-                log(f"Tower spawned: {tower}", "DEBUG")
+                if _DEBUG:
+                    log(f"Tower spawned: {tower}", "DEBUG")
 
-            # Draw towers
+            # Draw towers, compacting the live ones to the front of the list in place
+            live = 0
             for tower in towers:
                 tower["z"] -= SPEED
                 if tower["z"] > 0:
-                    px0, py0 = project_flight(tower["side"], 0.0, tower["z"], cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y, wall_mode=True)
-                    px1, py1 = project_flight(tower["side"], tower["height"], tower["z"], cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y, wall_mode=True)
-                    distance_factor = tower["z"] / (SEGMENTS * grid_spacing)
-                    brightness_factor = max(0.1, (1.0 - distance_factor) ** 2.0)
-                    value = max(0.12, min(1.0, brightness_factor))
-                    r, g, b = hsv_to_rgb(tower["hue"], 0.85, value)
-                    tower_dynamic_pen = graphics.create_pen(int(r), int(g), int(b))
-                    graphics.set_pen(tower_dynamic_pen)
-                    graphics.line(px0, py0, px1, py1)
-            towers = [t for t in towers if t["z"] > 0]
+                    towers[live] = tower
+                    live += 1
+                    pose[_M_Z] = tower["z"]
+                    project_flight_wall(start_pt, pose, tower["side"], 0)
+                    project_flight_wall(end_pt, pose, tower["side"], tower["height"])
+                    graphics.set_pen(tower_pens[(tower["hue"] << 3) | tower_fog[tower["z"] >> 6]])
+                    graphics.line(start_pt[0], start_pt[1], end_pt[0], end_pt[1])
+            if live < len(towers):
+                del towers[live:]
 
             # Missile logic - fire exactly on countdown 0
             if (not missile_hang and len(missiles) < 1 and countdown_phase_started and 
                 countdown is not None and countdown == 0):
-                missile = {"z": 0.5, "speed": SPEED * 1.5, "dipping": False, "dip_progress": 0.0}
+                missile = {"z": 128, "speed": (SPEED * 3) >> 1, "dipping": False, "dip_progress": 0.0}
                 missiles.append(missile)
                 log(f"Missile fired at countdown 0!", "INFO")
 
+            if missiles:
+                set_pose(steady_pose, k_focal, cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, 0, 0)
             for missile in missiles:
                 if not missile["dipping"]:
                     missile["z"] += missile["speed"]
-                    log(f"Missile z updated: {missile['z']}", "DEBUG")
-                    if missile["z"] >= SEGMENTS * grid_spacing - 1.0:
+                    if _DEBUG:
+                        log(f"Missile z updated: {missile['z']}", "DEBUG")
+                    if missile["z"] >= max_z - 256:
                         missile["dipping"] = True
                         missile["dip_progress"] = 0.0
                         missile_hang = True
                         missile_hang_time = elapsed
-                        log("Missile reached end, starting hang/dip", "DEBUG")
+                        if _DEBUG:
+                            log("Missile reached end, starting hang/dip", "DEBUG")
                 else:
                     missile["dip_progress"] += 0.04
-                    log(f"Missile dipping, progress: {missile['dip_progress']}", "DEBUG")
-
-                missile_height = 0.5 - (missile["dip_progress"] * 0.6 if missile["dipping"] else 0.0)
-                px, py = project_flight(0.0, missile_height,
-                                        min(missile["z"], SEGMENTS * grid_spacing - 1.0),
-                                        cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, 0, 0)
+                    if _DEBUG:
+                        log(f"Missile dipping, progress: {missile['dip_progress']}", "DEBUG")
+
+                missile_height = 128 - (int(missile["dip_progress"] * 154) if missile["dipping"] else 0)
+                steady_pose[_M_Z] = min(missile["z"], max_z - 256)
+                project_flight(start_pt, steady_pose, 0, missile_height)
+                px = start_pt[0]
+                py = start_pt[1]
                 graphics.set_pen(blue_pen)
                 if 0 <= px < WIDTH and 0 <= py < HEIGHT:
                     graphics.pixel(px, py)
@@ -416,56 +631,11 @@ async def run(graphics, gu, state, interrupt_event):
                 missiles.clear()
                 missile_hang = False
                 explosion_active = True
-                explosion_start = utime.ticks_ms()
+                explosion_start = current_time
                 
-                # Create fireworks-style explosion particles
-                center_x = WIDTH >> 1
-                center_y = HEIGHT >> 1
-                num_particles = 60  # Lots of particles for spectacular explosion
-                
-                # Create multi-colored bursts
-                colors = [
-                    (255, 255, 255),  # White core
-                    (255, 220, 0),    # Yellow
-                    (255, 150, 0),    # Orange  
-                    (255, 50, 50),    # Red
-                    (255, 100, 200),  # Pink
-                ]
-                
-                for i in range(num_particles):
-                    angle = (i / num_particles) * 6.28318  # Full circle
-                    speed = random.uniform(0.8, 2.5)
-                    color = random.choice(colors)
-                    life = random.randint(25, 45)
-                    
-                    # Add some randomness to create irregular burst pattern  
-                    angle += random.uniform(-0.3, 0.3)
-                    
-                    vx = fast_cos(angle) * speed
-                    vy = fast_sin(angle) * speed
-                    
-                    explosion_particles.append(ExplosionParticle(
-                        center_x, center_y, vx, vy, color, life
-                    ))
-                
-                # Create expanding circles for spectacular effect
-                circle_colors = [
-                    (255, 255, 255),  # White
-                    (255, 220, 0),    # Yellow  
-                    (255, 150, 0),    # Orange
-                    (255, 50, 50),    # Red
-                ]
-                
-                for i, color in enumerate(circle_colors):
-                    explosion_circles.append({
-                        "start_time": utime.ticks_ms() + (i * 150),  # Stagger circle starts
-                        "color": color,
-                        "max_radius": 8 + i * 2,  # Different max sizes
-                        "duration": 800 + i * 200,  # Different durations
-                        "thickness": 1 if i < 2 else 2,  # Thicker outer circles
-                    })
-                
-                log("Fireworks explosion with expanding circles triggered!", "INFO")
+                # Particles and circles are set up on the first explosion frame,
+                # so the trigger frame stays light and the flash starts at once
+                explosion_setup_pending = True
 
             # Laser effects
             laser_spawn_rate = 0.04 + urgency_factor * 0.02
@@ -473,21 +643,21 @@ async def run(graphics, gu, state, interrupt_event):
                 tower = random.choice(towers)
                 
                 # Add depth-based angle variation for more realistic 3D effect
-                depth_factor = tower["z"] / (SEGMENTS * grid_spacing)
+                depth_factor = tower["z"] / max_z
                 
                 # 40% chance for "towards viewer" shots, 60% for cross-trench shots
                 if random.random() < 0.4:
                     # Shoot towards viewer (center screen, closer to camera)
-                    target_side = tower["side"] * random.uniform(0.1, 0.3)  # Much closer to center
-                    angle_variation = 0.8  # Large angle variation for dramatic effect
-                    height_offset = random.uniform(-0.5, 0.5)  # Wide height variation
-                    target_z_offset = -random.uniform(2.0, 4.0)  # Shoot towards camera
+                    target_side = int(tower["side"] * random.uniform(0.1, 0.3))  # Much closer to center
+                    angle_variation = 205  # Large angle variation for dramatic effect (0.8)
+                    height_offset = int(random.uniform(-128, 128))  # Wide height variation
+                    target_z_offset = -int(random.uniform(512, 1024))  # Shoot towards camera
                 else:
                     # Cross-trench shots (original behavior but enhanced)
                     target_side = -tower["side"]
-                    angle_variation = (0.5 - depth_factor) * 0.6  # Increased angle variation
-                    height_offset = random.uniform(-0.3, 0.4) * depth_factor
-                    target_z_offset = 0.0
+                    angle_variation = (0.5 - depth_factor) * 154  # Increased angle variation (0.6)
+                    height_offset = int(random.uniform(-77, 102) * depth_factor)
+                    target_z_offset = 0
                 
                 laser = {
                     "source_tower": tower,
@@ -495,45 +665,46 @@ async def run(graphics, gu, state, interrupt_event):
                     "z": tower["z"],
                     "target_z_offset": target_z_offset,
                     "progress": 0.0,
-                    "angle_offset": random.uniform(-angle_variation, angle_variation),
+                    "angle_offset": int(random.uniform(-angle_variation, angle_variation)),
                     "height_offset": height_offset,
                 }
                 lasers.append(laser)
-                log(f"Laser spawned from tower: {tower}", "DEBUG")
+                if _DEBUG:
+                    log(f"Laser spawned from tower: {tower}", "DEBUG")
 
+            live = 0
             for laser in lasers:
                 laser["progress"] += 0.12
                 prog = min(1.0, laser["progress"])
                 tower = laser["source_tower"]
                 
                 # Calculate start position (tower top)
-                start_x, start_y = project_flight(
-                    tower["side"], tower["height"], tower["z"],
-                    cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y, wall_mode=True
-                )
+                pose[_M_Z] = tower["z"]
+                project_flight_wall(start_pt, pose, tower["side"], tower["height"])
+                start_x = start_pt[0]
+                start_y = start_pt[1]
                 
                 # Calculate angled target position with depth-based variation
                 target_x = laser["target_side"] + laser["angle_offset"]
                 target_y = tower["height"] + laser["height_offset"]
-                target_z = laser["z"] + laser["target_z_offset"]  # For "towards viewer" shots
-                
-                end_x, end_y = project_flight(
-                    target_x, target_y, target_z,
-                    cos_roll, sin_roll, cos_pitch, sin_pitch, altitude, shake_x, shake_y, wall_mode=True
-                )
+                pose[_M_Z] = laser["z"] + laser["target_z_offset"]  # For "towards viewer" shots
+                project_flight_wall(end_pt, pose, target_x, target_y)
+                end_x = end_pt[0]
+                end_y = end_pt[1]
                 
                 curr_x = int(start_x + (end_x - start_x) * prog)
                 curr_y = int(start_y + (end_y - start_y) * prog)
-                tower_hue = tower["hue"]
-                r, g, b = hsv_to_rgb(tower_hue, 1.0, 1.0)
-                laser_pen = graphics.create_pen(int(r), int(g), int(b))
-                graphics.set_pen(laser_pen)
+                graphics.set_pen(laser_pens[tower["hue"]])
                 graphics.line(start_x, start_y, curr_x, curr_y)
-            lasers = [l for l in lasers if l["progress"] < 1.0]
+                if laser["progress"] < 1.0:
+                    lasers[live] = laser
+                    live += 1
+            if live < len(lasers):
+                del lasers[live:]
 
             # Countdown update with dynamic acceleration (only if countdown phase has started)
             if countdown_phase_started and countdown is not None and countdown > 0 and not missile_hang:
-                now = utime.ticks_ms()
+                now = current_time
                 
                 # Calculate current countdown interval based on progress (accelerating)
                 progress = 1.0 - (countdown / countdown_start)  # 0.0 at start, 1.0 at end
@@ -546,7 +717,7 @@ async def run(graphics, gu, state, interrupt_event):
                     last_countdown_update = now
                     if countdown == 0:
                         log("Countdown reached 0 - missile will fire!", "INFO")
-                    elif countdown % 10 == 0:  # Log every 10th countdown for debugging
+                    elif _DEBUG and countdown % 10 == 0:  # Log every 10th countdown for debugging
                         log(f"Countdown: {countdown} (interval: {current_interval:.2f}s)", "DEBUG")
 
             # Only draw countdown if countdown phase has started
@@ -554,59 +725,80 @@ async def run(graphics, gu, state, interrupt_event):
                 draw_countdown(graphics, countdown, red_pen, y=1)
 
         else:
-            log("Explosion animation running", "DEBUG")
-            explosion_time = (utime.ticks_ms() - explosion_start) * 0.001
+            if _DEBUG:
+                log("Explosion animation running", "DEBUG")
+            if explosion_setup_pending:
+                explosion_setup_pending = False
+                # Create fireworks-style explosion particles
+                center_x = WIDTH >> 1
+                center_y = HEIGHT >> 1
+                num_particles = 60  # Lots of particles for spectacular explosion
+            
+                # Create multi-colored bursts; integer randoms keep the trigger frame allocation-free
+                for i in range(num_particles):
+                    angle = (i << 10) // num_particles  # Full circle, as a sin_lut index
+                    speed = 205 + ((random.getrandbits(8) * 435) >> 8)  # 0.8 to 2.5 in Q8
+                    color = (random.getrandbits(8) * len(PARTICLE_COLORS)) >> 8
+                    life = 25 + ((random.getrandbits(8) * 21) >> 8)  # 25 to 45 frames
+                
+                    # Add some randomness to create irregular burst pattern (+-0.3 rad)
+                    angle = (angle + (((random.getrandbits(8) - 128) * 49) >> 7)) & 1023
+                
+                    particles[_P_X + i] = center_x << 8
+                    particles[_P_Y + i] = center_y << 8
+                    particles[_P_VX + i] = (sin_lut[(angle + 256) & 1023] * speed) >> 15
+                    particles[_P_VY + i] = (sin_lut[angle] * speed) >> 15
+                    particles[_P_AGE + i] = 0
+                    particles[_P_LIFE + i] = life
+                    particles[_P_COLOR + i] = color * (_FADE_LEVELS + 1)
+                particle_count = num_particles
+            
+                # Create expanding circles for spectacular effect
+                circle_colors = [
+                    (255, 255, 255),  # White
+                    (255, 220, 0),    # Yellow  
+                    (255, 150, 0),    # Orange
+                    (255, 50, 50),    # Red
+                ]
+            
+                for i, color in enumerate(circle_colors):
+                    explosion_circles.append({
+                        "start_time": explosion_start + (i * 150),  # Stagger circle starts
+                        "color": color,
+                        "max_radius": 8 + i * 2,  # Different max sizes
+                        "duration": 800 + i * 200,  # Different durations
+                        "thickness": 1 if i < 2 else 2,  # Thicker outer circles
+                    })
+            
+                log("Fireworks explosion with expanding circles triggered!", "INFO")
+
+            explosion_ms = utime.ticks_diff(current_time, explosion_start)
             
             # Initial flash effect
-            if explosion_time < 0.15:
-                if int(explosion_time * 30) % 2 == 0:
-                    graphics.set_pen(white_pen)
-                else:
-                    graphics.set_pen(explosion_yellow_pen)
+            if explosion_ms < 150:
+                graphics.set_pen(flash_pens[((explosion_ms * 3) // 100) & 1])
                 graphics.clear()
             else:
                 graphics.set_pen(black_pen)
                 graphics.clear()
                 
                 # Update and draw explosion particles
-                i = 0
-                while i < len(explosion_particles):
-                    particle = explosion_particles[i]
-                    if particle.update():
-                        # Calculate fade based on particle age
-                        fade = 1.0 - (particle.age / particle.life)
-                        fade = max(0.0, fade)
-                        
-                        px = int(particle.x)
-                        py = int(particle.y)
-                        
-                        if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                            r, g, b = particle.color
-                            r = int(r * fade)
-                            g = int(g * fade)
-                            b = int(b * fade)
-                            graphics.set_pen(graphics.create_pen(r, g, b))
-                            graphics.pixel(px, py)
-                            
-                            # Add sparkle effect for some particles
-                            if random.random() < 0.3 and fade > 0.5:
-                                for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                                    sx, sy = px + dx, py + dy
-                                    if 0 <= sx < WIDTH and 0 <= sy < HEIGHT:
-                                        sparkle_fade = fade * 0.4
-                                        sr = int(r * sparkle_fade)
-                                        sg = int(g * sparkle_fade)  
-                                        sb = int(b * sparkle_fade)
-                                        graphics.set_pen(graphics.create_pen(sr, sg, sb))
-                                        graphics.pixel(sx, sy)
-                        i += 1
-                    else:
-                        # Remove dead particle
-                        explosion_particles[i] = explosion_particles[-1]
-                        explosion_particles.pop()
+                particle_count = update_particles(particles, particle_count, WIDTH, HEIGHT)
+                d = _P_DRAW
+                for _ in range(particles[_P_DRAWN]):
+                    px = particles[d]
+                    py = particles[d + 1]
+                    graphics.set_pen(particle_pens[particles[d + 2]])
+                    graphics.pixel(px, py)
+                    
+                    # Add sparkle effect for some particles
+                    sparkle_pen = particles[d + 3]
+                    if random.random() < 0.3 and sparkle_pen >= 0:
+                        graphics.set_pen(particle_pens[sparkle_pen])
+                        draw_sparkle(graphics, px, py)
+                    d += 4
                         
                 # Draw expanding circles
-                current_time = utime.ticks_ms()
                 center_x = WIDTH >> 1
                 center_y = HEIGHT >> 1
                 
@@ -614,31 +806,33 @@ async def run(graphics, gu, state, interrupt_event):
                 while i < len(explosion_circles):
                     circle = explosion_circles[i]
                     if current_time >= circle["start_time"]:
-                        elapsed = current_time - circle["start_time"]
+                        circle_ms = current_time - circle["start_time"]
+                        duration = circle["duration"]
                         
-                        if elapsed < circle["duration"]:
-                            # Calculate current radius and fade
-                            progress = elapsed / circle["duration"]
-                            radius = int(circle["max_radius"] * progress)
-                            fade = 1.0 - progress  # Fade out as it expands
+                        if circle_ms < duration:
+                            # Calculate current radius and Q8 fade, fading out as it expands
+                            radius = (circle["max_radius"] * circle_ms) // duration
+                            fade_q8 = 256 - (circle_ms << 8) // duration
                             
                             # Draw circle with fade
-                            if radius > 0 and fade > 0.1:
+                            if radius > 0 and fade_q8 > 25:
                                 r, g, b = circle["color"]
-                                r = int(r * fade)
-                                g = int(g * fade)
-                                b = int(b * fade)
-                                circle_pen = graphics.create_pen(r, g, b)
+                                circle_pen = graphics.create_pen((r * fade_q8) >> 8, (g * fade_q8) >> 8, (b * fade_q8) >> 8)
                                 graphics.set_pen(circle_pen)
                                 
-                                # Draw circle outline - use multiple thickness for outer circles
+                                # Draw circle outline as a closed 24-segment polyline (line clips
+                                # natively) - use multiple thickness for outer circles
                                 for thickness in range(circle["thickness"]):
-                                    for angle_step in range(0, 360, 8):  # Draw circle in 8-degree steps
-                                        angle = angle_step * 0.017453  # Convert to radians
-                                        px = center_x + int((radius + thickness) * fast_cos(angle))
-                                        py = center_y + int((radius + thickness) * fast_sin(angle))
-                                        if 0 <= px < WIDTH and 0 <= py < HEIGHT:
-                                            graphics.pixel(px, py)
+                                    ring_radius = radius + thickness
+                                    first_x = prev_x = center_x + ring_radius
+                                    first_y = prev_y = center_y
+                                    for k in range(1, 24):  # 15-degree segments
+                                        px = center_x + ((ring_radius * _RING_COS[k]) >> 12)
+                                        py = center_y + ((ring_radius * _RING_SIN[k]) >> 12)
+                                        graphics.line(prev_x, prev_y, px, py)
+                                        prev_x = px
+                                        prev_y = py
+                                    graphics.line(prev_x, prev_y, first_x, first_y)
                             i += 1
                         else:
                             # Remove expired circle
@@ -648,12 +842,15 @@ async def run(graphics, gu, state, interrupt_event):
                         i += 1
                         
             # End explosion when all particles and circles are gone
-            if explosion_time > 1.0 and len(explosion_particles) == 0 and len(explosion_circles) == 0:
+            if explosion_ms > 1000 and particle_count == 0 and len(explosion_circles) == 0:
                 log("Fireworks explosion with circles complete, exiting animation", "INFO")
                 return
 
         gu.update(graphics)
-        log(f"Elapsed: {elapsed:.2f}, missile_hang: {missile_hang}, explosion_active: {explosion_active}, missiles: {len(missiles)}", "DEBUG")
-        await uasyncio.sleep(0.02)
+        if _DEBUG:
+            log(f"Elapsed: {elapsed:.2f}, missile_hang: {missile_hang}, explosion_active: {explosion_active}, missiles: {len(missiles)}", "DEBUG")
+        # Hold a steady frame period: sleep off what is left of the budget, but always yield
+        frame_ms = utime.ticks_diff(utime.ticks_ms(), current_time)
+        await uasyncio.sleep(max(1, _FRAME_MS - frame_ms) * 0.001)
 
     log("Trench run animation interrupted", "INFO")
@@ -1,8 +1,9 @@
 import uasyncio
 import math
 import random
+import array
 
-from animations.utils import hsv_to_rgb
+from animations.utils import fast_hue_rgb
 
 async def run(graphics, gu, state, interrupt_event):
     # twisting wireframe tunnel effect that is somewhat broken but I like it.
@@ -28,7 +29,19 @@ async def run(graphics, gu, state, interrupt_event):
     screen_center_y = HEIGHT / 2
     max_z = num_segments * segment_depth
 
-    segments_z = [(i + 1) * segment_depth for i in range(num_segments)]
+    # Ring vertex offsets are fixed, so the trig runs once here. Projected rings
+    # go into two x, y interleaved buffers that swap roles each segment
+    ring_cos = array.array('f', [tunnel_radius * math.cos(p / points_per_segment * 2 * math.pi)
+                                 for p in range(points_per_segment)])
+    ring_sin = array.array('f', [tunnel_radius * math.sin(p / points_per_segment * 2 * math.pi)
+                                 for p in range(points_per_segment)])
+    cur_xy = array.array('i', [0] * (points_per_segment * 2))
+    prev_xy = array.array('i', [0] * (points_per_segment * 2))
+
+    # Segment depths as a ring buffer; head is the nearest segment, and the one
+    # before it (wrapping) the farthest
+    segments_z = array.array('f', [(i + 1) * segment_depth for i in range(num_segments)])
+    head = 0
     time_offset = 0.0
 
     while not interrupt_event.is_set():
@@ -36,56 +49,56 @@ async def run(graphics, gu, state, interrupt_event):
         graphics.clear()
 
         time_offset += zoom_speed
-        segments_z.sort(reverse=True)
-        new_segments_z = []
+        for k in range(num_segments):
+            segments_z[k] -= zoom_speed
         current_hue = (hue_start + time_offset * hue_speed) % 1.0
-        projected_points_prev = None
+        # Full-brightness colour for this frame; each segment scales it by depth
+        r0, g0, b0 = fast_hue_rgb(current_hue, 1.0)
+        have_prev = False
 
-        for i, z in enumerate(segments_z):
-            z -= zoom_speed
-            new_segments_z.append(z)
+        # Draw far to near
+        for k in range(num_segments - 1, -1, -1):
+            z = segments_z[(head + k) % num_segments]
             if z <= 0.1:
                 continue
 
             path_x = path_amplitude_x * math.sin(z * path_freq_x + time_offset * path_time_speed_x)
             path_y = path_amplitude_y * math.cos(z * path_freq_y + time_offset * path_time_speed_y)
-            projected_points_current = []
-
+            scale = focal_length / z
             for p in range(points_per_segment):
-                angle = (p / points_per_segment) * 2 * math.pi
-                x3d = path_x + tunnel_radius * math.cos(angle)
-                y3d = path_y + tunnel_radius * math.sin(angle)
-                scale = focal_length / z
-                sx = int(screen_center_x + x3d * scale)
-                sy = int(screen_center_y + y3d * scale)
-                projected_points_current.append((sx, sy))
-
-            brightness = max(0.0, min(1.0, 1.0 - (z / max_z)))
-            r, g, b = hsv_to_rgb(current_hue, 1.0, brightness)
-            pen = graphics.create_pen(r, g, b)
+                cur_xy[2 * p] = int(screen_center_x + (path_x + ring_cos[p]) * scale)
+                cur_xy[2 * p + 1] = int(screen_center_y + (path_y + ring_sin[p]) * scale)
+
+            br = int(max(0.0, min(1.0, 1.0 - (z / max_z))) * 256)  # Q8 brightness
+            pen = graphics.create_pen((r0 * br) >> 8, (g0 * br) >> 8, (b0 * br) >> 8)
             graphics.set_pen(pen)
 
             for p in range(points_per_segment):
-                x1, y1 = projected_points_current[p]
-                x2, y2 = projected_points_current[(p + 1) % points_per_segment]
+                x1 = cur_xy[2 * p]
+                y1 = cur_xy[2 * p + 1]
+                q = (p + 1) % points_per_segment
+                x2 = cur_xy[2 * q]
+                y2 = cur_xy[2 * q + 1]
                 if 0 <= x1 < WIDTH and 0 <= y1 < HEIGHT and 0 <= x2 < WIDTH and 0 <= y2 < HEIGHT:
                     graphics.line(x1, y1, x2, y2)
 
-            if projected_points_prev is not None and len(projected_points_prev) == points_per_segment:
+            if have_prev:
                 for p in range(points_per_segment):
-                    x1, y1 = projected_points_current[p]
-                    x2, y2 = projected_points_prev[p]
+                    x1 = cur_xy[2 * p]
+                    y1 = cur_xy[2 * p + 1]
+                    x2 = prev_xy[2 * p]
+                    y2 = prev_xy[2 * p + 1]
                     if 0 <= x1 < WIDTH and 0 <= y1 < HEIGHT and 0 <= x2 < WIDTH and 0 <= y2 < HEIGHT:
                         graphics.line(x1, y1, x2, y2)
 
-            projected_points_prev = projected_points_current
+            cur_xy, prev_xy = prev_xy, cur_xy
+            have_prev = True
 
-        segments_z = [z for z in new_segments_z if z > 0.1]
-        while len(segments_z) < num_segments:
-            current_max_z = max(segments_z) if segments_z else 0.0
-            new_z = current_max_z + segment_depth
-            segments_z.append(new_z)
-            max_z = max(segments_z)
+        # Recycle segments that have passed the camera to the far end
+        while segments_z[head] <= 0.1:
+            max_z = segments_z[(head - 1) % num_segments] + segment_depth
+            segments_z[head] = max_z
+            head = (head + 1) % num_segments
 
         gu.update(graphics)
         await uasyncio.sleep(0.01)
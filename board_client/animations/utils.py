@@ -6,32 +6,29 @@ import ustruct
 import gc
 
 _TWO_PI = micropython.const(math.pi * 2.0)
-_INV_TWO_PI = micropython.const(1.0 / (math.pi * 2.0))
-_TABLE_SIZE = micropython.const(100)
-_TABLE_SIZE_FLOAT = micropython.const(100.0)
+# Power-of-two table so angles wrap with a mask rather than a modulo
+_TABLE_SIZE = micropython.const(256)
+_TABLE_SIZE_FLOAT = micropython.const(256.0)
+_TABLE_SCALE = micropython.const(256.0 / (math.pi * 2.0))
+# Whole turns added before truncating so int() floors negative angles too;
+# valid for angles above -16 turns
+_TABLE_BIAS = micropython.const(4096.0)
 
 SIN_TABLE = array.array('f', [math.sin(i / _TABLE_SIZE_FLOAT * _TWO_PI) for i in range(_TABLE_SIZE)])
 COS_TABLE = array.array('f', [math.cos(i / _TABLE_SIZE_FLOAT * _TWO_PI) for i in range(_TABLE_SIZE)])
 
+# Integer sine for fixed-point callers: Q15 values over 1024 steps per turn.
+# Index with `a & 1023` to wrap, add 256 for cosine
+_SIN_LUT_SIZE = micropython.const(1024)
+SIN_LUT_Q15 = array.array('h', [int(math.sin(i * _TWO_PI / _SIN_LUT_SIZE) * 32767) for i in range(_SIN_LUT_SIZE)])
+
 @micropython.native
 def fast_sin(angle):
-    angle %= _TWO_PI
-    if angle < 0.0: angle += _TWO_PI
-    index_f = angle * _INV_TWO_PI * _TABLE_SIZE_FLOAT
-    index = int(index_f)
-    if index < 0: index = 0
-    if index >= _TABLE_SIZE: index = _TABLE_SIZE - 1
-    return SIN_TABLE[index]
+    return SIN_TABLE[int(angle * _TABLE_SCALE + _TABLE_BIAS) & 255]
 
 @micropython.native
 def fast_cos(angle):
-    angle %= _TWO_PI
-    if angle < 0.0: angle += _TWO_PI
-    index_f = angle * _INV_TWO_PI * _TABLE_SIZE_FLOAT
-    index = int(index_f)
-    if index < 0: index = 0
-    if index >= _TABLE_SIZE: index = _TABLE_SIZE - 1
-    return COS_TABLE[index]
+    return COS_TABLE[int(angle * _TABLE_SCALE + _TABLE_BIAS) & 255]
 
 @micropython.native
 def hsv_to_rgb(h, s, v):
@@ -65,23 +62,41 @@ def hsv_to_rgb(h, s, v):
     if i == 4: return t, p, v_int
     return v_int, p, q
 
+# Full-saturation, full-value hue wheel at 256 steps, r, g, b interleaved
+HUE_LUT = bytearray(768)
+for _i in range(256):
+    HUE_LUT[_i * 3], HUE_LUT[_i * 3 + 1], HUE_LUT[_i * 3 + 2] = hsv_to_rgb(_i / 256.0, 1.0, 1.0)
+
+@micropython.native
+def fast_hue_rgb(h, v):
+    """hsv_to_rgb(h, 1.0, v) from the hue table, with integer value scaling"""
+    i = (int(h * 256) & 255) * 3
+    vq = int(v * 256)
+    return (HUE_LUT[i] * vq) >> 8, (HUE_LUT[i + 1] * vq) >> 8, (HUE_LUT[i + 2] * vq) >> 8
+
 def lerp(a, b, t, max_t):
     return a + (b - a) * t // max_t
 
 def make_palette(keys, size):
-    palette = []
+    # Flat r, g, b bytes: colour i is palette[i * 3:i * 3 + 3]
+    palette = bytearray(size * 3)
     n = len(keys)
     seg = size // (n - 1)
+    o = 0
     for i in range(n - 1):
         c1 = keys[i]
         c2 = keys[i + 1]
         for j in range(seg):
-            r = lerp(c1[0], c2[0], j, seg)
-            g = lerp(c1[1], c2[1], j, seg)
-            b = lerp(c1[2], c2[2], j, seg)
-            palette.append((r, g, b))
-    while len(palette) < size:
-        palette.append(keys[-1])
+            palette[o] = lerp(c1[0], c2[0], j, seg)
+            palette[o + 1] = lerp(c1[1], c2[1], j, seg)
+            palette[o + 2] = lerp(c1[2], c2[2], j, seg)
+            o += 3
+    last = keys[-1]
+    while o < size * 3:
+        palette[o] = last[0]
+        palette[o + 1] = last[1]
+        palette[o + 2] = last[2]
+        o += 3
     return palette
 
 def falloff(dy, width):
@@ -94,37 +109,20 @@ def falloff(dy, width):
 
 # Item 50: Universal object pooling system
 class UniversalObjectPool:
-    """Generic object pool for any type with reset() method"""
+    """Generic free-list pool; callers release every object they acquire"""
     def __init__(self, factory_func, initial_size=10, max_size=50):
         self.factory_func = factory_func
         self.available = [factory_func() for _ in range(initial_size)]
-        self.in_use = []
         self.max_size = max_size
     
     def acquire(self):
         if self.available:
-            obj = self.available.pop()
-        else:
-            obj = self.factory_func()
-        self.in_use.append(obj)
-        return obj
+            return self.available.pop()
+        return self.factory_func()
     
     def release(self, obj):
-        if obj in self.in_use:
-            self.in_use.remove(obj)
-            if len(self.available) < self.max_size:
-                self.available.append(obj)
-    
-    def release_all(self):
-        space = max(0, self.max_size - len(self.available))
-        if space > 0:
-            moved = self.in_use[:space]
-            self.available.extend(moved)
-            # Remove the moved objects from in_use
-            self.in_use = self.in_use[space:]
-        else:
-            # No space available, just clear in_use (objects are discarded)
-            self.in_use.clear()
+        if len(self.available) < self.max_size:
+            self.available.append(obj)
 
 # Item 51: Color depth reduction using 6-6-6 RGB palette quantization
 COLOR_PALETTE_666 = []
@@ -1,11 +1,12 @@
 import uasyncio
 import math
-import random
 import gc
 import sys
 import os
+import array
+import micropython
 
-from animations.utils import hsv_to_rgb
+from animations.utils import fast_hue_rgb, uwPrng
 from uw.hardware import WIDTH, HEIGHT, MODEL
 from uw.logger import log
 
@@ -21,30 +22,36 @@ def get_wireframe_list():
     except OSError:
         return []
 
-def rotate_vertex(v, ax, ay, az):
-    x, y, z = v
-    cy, sy = math.cos(ax), math.sin(ax)
-    y, z = y * cy - z * sy, y * sy + z * cy
-    cx, sx = math.cos(ay), math.sin(ay)
-    x, z = x * cx + z * sx, -x * sx + z * cx
+# Shuffle order and starting hues come from the lightweight LCG in utils
+_PRNG = uwPrng()
+
+# Perspective projection: field of view and camera distance, in model units
+_FOV = micropython.const(220)
+_VIEWER_DISTANCE = micropython.const(300)
+
+# Zoom range and depth bounds per wireframe name, so models that come round
+# again in the queue skip the scale search
+_SCALE_CACHE = {}
+
+def rotation_matrix(ax, ay, az):
+    # Rotations about X, then Y, then Z composed into one row-major 3x3
+    cx, sx = math.cos(ax), math.sin(ax)
+    cy, sy = math.cos(ay), math.sin(ay)
     cz, sz = math.cos(az), math.sin(az)
-    x, y = x * cz - y * sz, x * sz + y * cz
-    return (x, y, z)
+    return (cz * cy, cz * sy * sx - sz * cx, cz * sy * cx + sz * sx,
+            sz * cy, sz * sy * sx + cz * cx, sz * sy * cx - cz * sx,
+            -sy, cy * sx, cy * cx)
 
 def project_vertex(v, scale, xoff, yoff):
     x, y, z = v
-    fov = 220
-    viewer_distance = 300
-    factor = fov / (z + viewer_distance)
+    factor = _FOV / (z + _VIEWER_DISTANCE)
     px = round(x * factor * scale + xoff)
     py = round(-y * factor * scale + yoff)
     return px, py
 
 def get_model_width_projected(vertices, scale):
-    xoff, yoff = 0, 0
-    rotated = [rotate_vertex(v, 0, 0, 0) for v in vertices]
-    projected = [project_vertex(v, scale, xoff, yoff) for v in rotated]
-    xs = [x for x, y in projected]
+    # Measured unrotated, so vertices project as they are
+    xs = [project_vertex(v, scale, 0, 0)[0] for v in vertices]
     return max(xs) - min(xs)
 
 def find_scale_for_width(vertices, target_width):
@@ -61,10 +68,109 @@ def find_scale_for_width(vertices, target_width):
 def shuffle(lst):
     n = len(lst)
     for i in range(n - 1, 0, -1):
-        j = random.randrange(i + 1)
+        j = _PRNG.randint(0, i)
         lst[i], lst[j] = lst[j], lst[i]
     return lst
 
+@micropython.native
+def render_frame(graphics, model, bufs, m, scale, color_hue):
+    # Project, cull, shade and draw one frame, using the per-model tuples and
+    # buffers render_wireframe sets up. The caller has already cleared the screen
+    vertices, edges, faces, model_z_near, model_z_far = model
+    proj_x, proj_y, rotated_z, codes, edge_shade, edge_order, shade_start, shade_pens = bufs
+    xoff = WIDTH // 2
+    yoff = HEIGHT // 2
+    x_max = WIDTH + 10
+    y_max = HEIGHT + 10
+    n_edges = len(edges)
+    
+    # Rotate and project vertices in one pass
+    m0, m1, m2, m3, m4, m5, m6, m7, m8 = m
+    i = 0
+    for x, y, z in vertices:
+        rz = m6 * x + m7 * y + m8 * z
+        s = _FOV / (rz + _VIEWER_DISTANCE) * scale
+        fx = (m0 * x + m1 * y + m2 * z) * s + xoff
+        fy = yoff - (m3 * x + m4 * y + m5 * z) * s
+        # Round half away from zero without calling round()
+        px = int(fx + 0.5) if fx >= 0 else int(fx - 0.5)
+        py = int(fy + 0.5) if fy >= 0 else int(fy - 0.5)
+        proj_x[i] = px
+        proj_y[i] = py
+        rotated_z[i] = rz
+        codes[i] = (px < -10) | ((px > x_max) << 1) | ((py < -10) << 2) | ((py > y_max) << 3)
+        i += 1
+    
+    # Backface culling if enabled; bit i set when face i is visible. Only the
+    # rotated normal's z decides it
+    visible_bits = 0
+    if faces:
+        # Reduce edge flickering
+        visibility_threshold = -0.15
+        bit = 1
+        for nx, ny, nz in faces:
+            if m6 * nx + m7 * ny + m8 * nz > visibility_threshold:
+                visible_bits |= bit
+            bit <<= 1
+    
+    # Cull and shade edges, counting each bucket
+    for k in range(17):
+        shade_start[k] = 0
+    for e in range(n_edges):
+        v1, v2, f1, f2 = edges[e]
+        edge_shade[e] = 255
+        
+        # Apply backface culling if enabled
+        if visible_bits and not ((visible_bits >> f1) & 1 or (visible_bits >> f2) & 1):
+            continue
+        
+        # Skip lines that are off-screen
+        if codes[v1] & codes[v2]:
+            continue
+        
+        # Depth shading
+        z1 = rotated_z[v1]
+        z2 = rotated_z[v2]
+        z_avg = (z1 + z2) / 2
+        
+        # Map z_avg to brightness
+        if model_z_near != model_z_far:
+            z_norm = (z_avg - model_z_far) / (model_z_near - model_z_far)
+        else:
+            z_norm = 0.5
+        brightness = 0.3 + 0.7 * z_norm
+        # Rotated depth can fall outside the model's z range; bucket 3 keeps
+        # the old 0.2 brightness floor so back edges stay visible
+        shade = max(3, min(15, int(brightness * 16)))
+        edge_shade[e] = shade
+        shade_start[shade + 1] += 1
+    
+    # Bucket offsets, then edge indices in bucket order
+    for k in range(1, 17):
+        shade_start[k] += shade_start[k - 1]
+    drawn = shade_start[16]
+    for e in range(n_edges):
+        shade = edge_shade[e]
+        if shade != 255:
+            edge_order[shade_start[shade]] = e
+            shade_start[shade] += 1
+    
+    # Draw edges, changing pen once per bucket
+    last_shade = -1
+    for k in range(drawn):
+        e = edge_order[k]
+        shade = edge_shade[e]
+        if shade != last_shade:
+            last_shade = shade
+            pen = shade_pens[shade]
+            if pen is None:
+                r, g, b = fast_hue_rgb(color_hue, (shade + 0.5) / 16)
+                pen = graphics.create_pen(r, g, b)
+                shade_pens[shade] = pen
+            graphics.set_pen(pen)
+        v1, v2, f1, f2 = edges[e]
+        graphics.line(proj_x[v1], proj_y[v1], proj_x[v2], proj_y[v2])
+
 async def render_wireframe(graphics, gu, wireframe_data, interrupt_event, duration=30.0):
     vertices = wireframe_data['vertices']
     edges = wireframe_data['edges']
@@ -73,7 +179,7 @@ async def render_wireframe(graphics, gu, wireframe_data, interrupt_event, durati
     use_backface_culling = wireframe_data.get('backface_culling', False)
     initial_scale_factor = wireframe_data.get('scale_factor', 1.0)
     
-    w, h = WIDTH, HEIGHT
+    w = WIDTH
     
     # Apply initial scale factor to vertices
     if initial_scale_factor != 1.0:
@@ -82,26 +188,52 @@ async def render_wireframe(graphics, gu, wireframe_data, interrupt_event, durati
     else:
         scaled_vertices = vertices
     
-    # Recalculate scaling based on scaled_vertices
-    min_scale = find_scale_for_width(scaled_vertices, w * 1.25)
-    if MODEL == "galactic":
-        max_scale = find_scale_for_width(scaled_vertices, w * 2.0)
+    name = wireframe_data.get('name')
+    cached = _SCALE_CACHE.get(name) if name else None
+    if cached:
+        min_scale, max_scale, model_z_near, model_z_far = cached
     else:
-        max_scale = find_scale_for_width(scaled_vertices, w * 2.5)
-    
-    xoff = w // 2
-    yoff = h // 2
+        # Recalculate scaling based on scaled_vertices
+        min_scale = find_scale_for_width(scaled_vertices, w * 1.25)
+        if MODEL == "galactic":
+            max_scale = find_scale_for_width(scaled_vertices, w * 2.0)
+        else:
+            max_scale = find_scale_for_width(scaled_vertices, w * 2.5)
+        
+        # Calc Z bounds for depth shading
+        z_coords = [v[2] for v in scaled_vertices]
+        model_z_near = max(z_coords)
+        model_z_far = min(z_coords)
+        if name:
+            _SCALE_CACHE[name] = (min_scale, max_scale, model_z_near, model_z_far)
     
     zoom_period = 12.0  # seconds for a full zoom in-out-in cycle
     
     t = 0.0
-    color_hue = random.random()  # Random starting hue for each model
+    color_hue = _PRNG.randfloat()  # Random starting hue for each model
     start_time = t
     
-    # Calc Z bounds for depth shading
-    z_coords = [v[2] for v in scaled_vertices]
-    model_z_near = max(z_coords)
-    model_z_far = min(z_coords)
+    # Per-vertex screen position and rotated depth, filled in place each frame
+    n = len(scaled_vertices)
+    proj_x = array.array('i', [0] * n)
+    proj_y = array.array('i', [0] * n)
+    rotated_z = array.array('f', [0.0] * n)
+    # Off-screen outcodes (left, right, top, bottom with a 10px margin); an edge
+    # whose ends share a bit lies wholly outside and is skipped
+    codes = bytearray(n)
+    
+    # Edges are drawn grouped by depth-shade bucket (counting sort into these
+    # buffers), so a frame needs at most 16 pens and 16 pen changes. 255 marks
+    # a culled edge
+    edge_shade = bytearray(len(edges))
+    edge_order = array.array('H', [0] * len(edges))
+    shade_start = array.array('H', [0] * 17)
+    shade_pens = [None] * 16
+    pen_hue = -1
+    
+    model = (scaled_vertices, edges, faces if use_backface_culling else (), model_z_near, model_z_far)
+    bufs = (proj_x, proj_y, rotated_z, codes, edge_shade, edge_order, shade_start, shade_pens)
+    black_pen = graphics.create_pen(0, 0, 0)
     
     while not interrupt_event.is_set() and (t - start_time) < duration:
         # Rotation
@@ -113,60 +245,20 @@ async def render_wireframe(graphics, gu, wireframe_data, interrupt_event, durati
         zoom_phase = (t / zoom_period) * 2 * math.pi
         scale = min_scale + (max_scale - min_scale) * (0.5 + 0.5 * math.sin(zoom_phase))
         
-        # Rotate and project vertices
-        rotated = [rotate_vertex(v, ax, ay, az) for v in scaled_vertices]
-        projected = [project_vertex(v, scale, xoff, yoff) for v in rotated]
-        rotated_z = [v[2] for v in rotated]
-        
-        # Backface culling if enabled
-        visible_faces = set()
-        if use_backface_culling and faces:
-            transformed_normals = []
-            for i, n in enumerate(faces):
-                nx, ny, nz = rotate_vertex(n, ax, ay, az)
-                transformed_normals.append((nx, ny, nz))
-            
-            # Reduce edge flickering
-            visibility_threshold = -0.15
-            visible_faces = set(i for i, n in enumerate(transformed_normals) if n[2] > visibility_threshold)
-        
-        graphics.set_pen(graphics.create_pen(0, 0, 0))
+        graphics.set_pen(black_pen)
         graphics.clear()
         
         color_hue = (color_hue + 0.0007) % 1.0
         
-        # Draw edges
-        for v1, v2, f1, f2 in edges:
-            # Apply backface culling if enabled
-            if use_backface_culling and visible_faces:
-                if f1 not in visible_faces and f2 not in visible_faces:
-                    continue
-            
-            x1, y1 = projected[v1]
-            x2, y2 = projected[v2]
-            
-            # Skip lines that are off-screen
-            if (x1 < -10 and x2 < -10) or (x1 > w + 10 and x2 > w + 10) or \
-               (y1 < -10 and y2 < -10) or (y1 > h + 10 and y2 > h + 10):
-                continue
-            
-            # Depth shading
-            z1 = rotated_z[v1]
-            z2 = rotated_z[v2]
-            z_avg = (z1 + z2) / 2
-            
-            # Map z_avg to brightness
-            if model_z_near != model_z_far:
-                z_norm = (z_avg - model_z_far) / (model_z_near - model_z_far)
-            else:
-                z_norm = 0.5
-            brightness = 0.3 + 0.7 * z_norm
-            brightness = max(0.2, min(1.0, brightness))
-            
-            r, g, b = hsv_to_rgb(color_hue, 1.0, brightness)
-            pen = graphics.create_pen(r, g, b)
-            graphics.set_pen(pen)
-            graphics.line(x1, y1, x2, y2)
+        # Shade pens are rebuilt lazily, only once the hue drifts to a new 1/256 step
+        hue_step = int(color_hue * 256)
+        if hue_step != pen_hue:
+            pen_hue = hue_step
+            for k in range(16):
+                shade_pens[k] = None
+        
+        # The trig for the rotation runs once per frame
+        render_frame(graphics, model, bufs, rotation_matrix(ax, ay, az), scale, color_hue)
         
         gu.update(graphics)
         t += 0.04
@@ -193,12 +285,12 @@ async def run(graphics, gu, state, interrupt_event):
         return
     
     model_duration = 30.0  # seconds to show each model
+    cursor = 0
     
     while not interrupt_event.is_set():
-        # take wireframe from queue
-        wireframe_name = wireframe_queue.pop(0)
-        # and put it on the end for looping.
-        wireframe_queue.append(wireframe_name)
+        # take the next wireframe, looping back to the start of the queue
+        wireframe_name = wireframe_queue[cursor]
+        cursor = (cursor + 1) % len(wireframe_queue)
         module_path = f"wireframes.{wireframe_name}"
 
         log(f"Wireframe: {wireframe_name}", "INFO")
@@ -208,6 +300,7 @@ async def run(graphics, gu, state, interrupt_event):
             mod = __import__(module_path, globals(), locals(), [wireframe_name], 0)
             
             wireframe_data = {
+                'name': wireframe_name,
                 'vertices': getattr(mod, 'VERTICES'),
                 'edges': getattr(mod, 'EDGES'), 
                 'faces': getattr(mod, 'FACES', []),
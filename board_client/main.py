@@ -1,22 +1,24 @@
 import uasyncio
 import machine
 import random
+import gc
+import micropython
 
 from uw.config import config
 from uw.logger import setup_logging, log
-from uw.hardware import graphics, gu, set_brightness
+from uw.hardware import graphics, gu, set_brightness, RED_PEN
 from uw.state import state
-from uw.animation_service import run_random_animation, run_named_animation, get_animation_list
+from uw.animation_service import run_random_animation, run_named_animation, ANIMATION_LIST, ANIMATION_SET
 from uw.background_tasks import button_monitor, debug_monitor
 from uw.transitions import melt_off, countdown
 from uw.service_manager import initialise_services
 from animations.utils import uwPrng
+# imported once up front: text can interrupt at any time, and animation_service
+# never unloads it
+from animations.text_scroller import run as run_text_scroller
 
-# conveyer belt
-def rotate_sequence(seq):
-    item = seq.pop(0)
-    seq.append(item)
-    return item
+# contiguous block that must still be allocatable to skip the max_iterations reset
+_RESET_PROBE_BYTES = micropython.const(16384)
 
 def create_random_pool(animation_list, sequence):
     """Create a randomized pool of animations excluding those explicitly in sequence"""
@@ -57,12 +59,12 @@ def get_next_random_animation(random_pool, pool_index):
     return animation, pool_index + 1
 
 async def handle_text_interrupt():
-    if state.interrupt_event.is_set():
-        state.interrupt_event.clear()
+    ev = state.interrupt_event
+    if ev.is_set():
+        ev.clear()
         if state.text_message:
-            from animations.text_scroller import run as run_text_scroller
             await run_text_scroller(
-                graphics, gu, state, state.interrupt_event,
+                graphics, gu, state, ev,
                 state.text_message, state.text_repeat_count
             )
             state.text_message = None
@@ -83,21 +85,24 @@ async def main():
         uasyncio.create_task(debug_monitor())
 
     # set animation sequence
-    sequence = list(config.get("general", "sequence", ["streaming", "*"]))
-    animation_list = get_animation_list()
+    sequence = tuple(config.get("general", "sequence", ["streaming", "*"]))
+    sequence_index = 0
     state.max_iterations = config.get("general", "max_iterations", -1)
+    max_runtime_s = config.get("general", "max_runtime_s", 120)
     
     # Create random animation pool excluding explicit sequence items
-    random_pool = create_random_pool(animation_list, sequence)
+    random_pool = create_random_pool(ANIMATION_LIST, sequence)
     random_pool_index = 0
     log(f"Random pool created with {len(random_pool)} animations", "INFO")
 
+    # tidy up after service start-up before the first animation loads
+    gc.collect()
+
     # main loop
     while True:
         if not state.display_on:
             await melt_off()
-            while not state.display_on:
-                await uasyncio.sleep(0.2)
+            await state.display_on_event.wait()
             await countdown()
 
         # publish mqtt text message here (and later -- todo: probably refactor as above)
@@ -106,7 +111,8 @@ async def main():
 
         if state.max_iterations != 0:
             # job sequence is an oraboros
-            job = rotate_sequence(sequence)
+            job = sequence[sequence_index]
+            sequence_index = (sequence_index + 1) % len(sequence)
 
             if state.max_iterations > 0 and state.next_animation != "onair":
                 # onair can loop indefinitely; only count non-onair iterations
@@ -120,15 +126,25 @@ async def main():
                     continue
 
             if job == "animation":
-                await run_random_animation(config.get("general", "max_runtime_s", 120))
-            elif job in animation_list:
-                await run_named_animation(job, config.get("general", "max_runtime_s", 120))
+                await run_random_animation(max_runtime_s)
+            elif job in ANIMATION_SET:
+                await run_named_animation(job, max_runtime_s)
             else:
                 log(f"Unknown sequence job: {job}", "WARN")
         else:
-            # Support maximum iteration limit to work around Pico 1 memory fragmentation
-            log(f"Maximum iterations reached, resetting", "INFO")
-            machine.reset()
+            # Support maximum iteration limit to work around Pico 1 memory fragmentation.
+            # Only reset if a collect can't free a decent contiguous block
+            gc.collect()
+            gc.collect()
+            try:
+                probe = bytearray(_RESET_PROBE_BYTES)
+                del probe
+                gc.collect()
+                state.max_iterations = config.get("general", "max_iterations", -1)
+                log("Maximum iterations reached, heap still healthy; continuing", "INFO")
+            except MemoryError:
+                log(f"Maximum iterations reached, resetting", "INFO")
+                machine.reset()
 
         if await handle_text_interrupt():
             continue
@@ -141,7 +157,7 @@ if __name__ == "__main__":
         log(f"Fatal error: {e}", "ERROR")
         # try to clear the display on crash
         try:
-            graphics.set_pen(graphics.create_pen(255, 0, 0))
+            graphics.set_pen(RED_PEN)
             graphics.clear()
             gu.update(graphics)
         except Exception:
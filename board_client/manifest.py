@@ -0,0 +1,17 @@
+# Frozen-module manifest for building Unicorn Wrangler into Pimoroni MicroPython.
+#
+#   make BOARD=PIMORONI_GALACTIC_UNICORN FROZEN_MANIFEST=/path/to/board_client/manifest.py
+#
+# Frozen bytecode is executed straight from flash, so these modules cost no
+# heap to parse at boot. Leave uw/ off the device when using a frozen build:
+# the filesystem comes first on sys.path and would shadow it.
+#
+# animations/ is deliberately not frozen. The animation list comes from
+# os.listdir("animations"), and MicroPython doesn't merge a package split
+# between flash and the filesystem, so animations stay as files.
+
+# keep everything the board already freezes
+include("$(BOARD_DIR)/manifest.py")
+
+# the framework: imported once at startup and never unloaded
+package("uw")
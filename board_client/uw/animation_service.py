@@ -3,22 +3,29 @@ import random
 import gc
 import sys
 import os
+import micropython
 
 from uw.state import state
 from uw.logger import log
 from uw.hardware import graphics, gu
 
 def get_animation_list():
-    files = os.listdir("animations")
     # exclude utils, text_scroller & onair
     exclude = {"utils.py", "text_scroller.py", "onair.py"}
-    anims = []
-    for f in files:
-        if f.endswith(".py") and f not in exclude:
-            anims.append(f[:-3])  # remove .py extension
-    return sorted(anims)
+    # names without the .py extension, as a sorted immutable tuple
+    return tuple(sorted(f[:-3] for f in os.listdir("animations")
+                        if f.endswith(".py") and f not in exclude))
 
 ANIMATION_LIST = get_animation_list()
+# Immutable name set for O(1) "is this an animation" checks
+ANIMATION_SET = frozenset(ANIMATION_LIST)
+
+# Recently run animation modules, least recent first. They stay imported so a
+# repeat run skips the parse; past the cap the oldest is unloaded
+_MOD_CACHE = []
+_MOD_CACHE_SIZE = micropython.const(3)
+# only collect between animations when free heap falls below this
+_GC_THRESHOLD = micropython.const(16384)
 
 async def run_named_animation(animation_name, max_runtime_s):
     # load and run a random animation for up to max_runtime_s seconds, interruptible
@@ -37,9 +44,7 @@ async def run_named_animation(animation_name, max_runtime_s):
     log(f"Loading animation: {animation_name}", "INFO")
     
     if state.mqtt_service and state.mqtt_service.connected:
-        state.mqtt_service.publish_status({
-            "animation": animation_name
-        })
+        state.mqtt_service.publish_animation(animation_name)
 
     try:
         # lazy load the animation module
@@ -62,10 +67,18 @@ async def run_named_animation(animation_name, max_runtime_s):
     finally:
         state.animation_active = False
         state.interrupt_event.set()
-        # unload module to free memory
-        if module_path in sys.modules:
-            del sys.modules[module_path]
-        gc.collect()
+        # main keeps text_scroller resident itself
+        if animation_name != "text_scroller":
+            if module_path in _MOD_CACHE:
+                _MOD_CACHE.remove(module_path)
+            _MOD_CACHE.append(module_path)
+            if len(_MOD_CACHE) > _MOD_CACHE_SIZE:
+                # unload the least recently used module to free memory
+                oldest = _MOD_CACHE.pop(0)
+                if oldest in sys.modules:
+                    del sys.modules[oldest]
+        if gc.mem_free() < _GC_THRESHOLD:
+            gc.collect()
     
     return success
 
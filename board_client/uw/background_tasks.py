@@ -1,40 +1,47 @@
 import gc
 import uasyncio
+import micropython
 
 from uw.hardware import gu
 from uw.state import state
 from uw.logger import log
 
+_DEBOUNCE_MS = micropython.const(300)
+_DEBUG_INTERVAL_S = micropython.const(30)
+_BUTTON_POLL_S = 0.05  # const() only folds ints
+
+_DBG_FMT = "State: anim={}, stream={}, display={}, mem={}{}"
+_STREAM_FMT = ", Stream: {} {}/{}"
+
 async def button_monitor():
     # hardware button actions (placeholder)
-    debounce_ms = 300
     while True:
         if gu.is_pressed(gu.SWITCH_A):
             log("Boop!", "INFO")
             # reset any looping animations
             state.next_animation = None            
             state.interrupt_event.set()
-            await uasyncio.sleep_ms(debounce_ms)
+            await uasyncio.sleep_ms(_DEBOUNCE_MS)
         elif gu.is_pressed(gu.SWITCH_B):
             state.display_on = not state.display_on
             log(f"Toggle display to {state.display_on}", "INFO")
-            await uasyncio.sleep_ms(debounce_ms)
+            await uasyncio.sleep_ms(_DEBOUNCE_MS)
         elif gu.is_pressed(gu.SWITCH_C):
             log("Scheduling moon for destruction", "INFO")
-            await uasyncio.sleep_ms(debounce_ms)
-        await uasyncio.sleep(0.05)
+            await uasyncio.sleep_ms(_DEBOUNCE_MS)
+        await uasyncio.sleep(_BUTTON_POLL_S)
 
 async def debug_monitor():
     while True:
         stream_info = ""
         if state.streaming_active:
-            name = getattr(state, 'stream_current_name', 'N/A')
-            rendered = getattr(state, 'stream_frames_rendered', 0)
-            total = getattr(state, 'stream_total_frames', 0)
-            stream_info = f", Stream: {name} {rendered}/{total}"
+            stream_info = _STREAM_FMT.format(state.stream_current_name or "N/A",
+                                             state.stream_frames_rendered,
+                                             state.stream_total_frames)
 
         log(
-            f"State: anim={state.animation_active}, stream={state.streaming_active}, display={state.display_on}, mem={gc.mem_free()}{stream_info}",
+            _DBG_FMT.format(state.animation_active, state.streaming_active,
+                            state.display_on, gc.mem_free(), stream_info),
             "DEBUG"
         )
-        await uasyncio.sleep(30)
+        await uasyncio.sleep(_DEBUG_INTERVAL_S)
@@ -38,23 +38,29 @@ _DEFAULT_CONFIG = {
 
 class Config:
     def __init__(self, filename="config.json"):
-        self._config = {}
-        self._config.update(_DEFAULT_CONFIG)
+        # flat (section, key) -> value map: one hash probe per get()
+        self._flat = {}
+        for section, values in _DEFAULT_CONFIG.items():
+            for key, value in values.items():
+                self._flat[(section, key)] = value
         try:
             with open(filename, "r") as f:
                 loaded = ujson.load(f)
                 for section, values in loaded.items():
-                    if section in self._config and isinstance(values, dict):
-                        self._config[section].update(values)
-                    else:
-                        self._config[section] = values
+                    if isinstance(values, dict):
+                        for key, value in values.items():
+                            self._flat[(section, key)] = value
         except Exception:
             pass
 
     def get(self, section, key, default=None):
-        return self._config.get(section, {}).get(key, default)
+        return self._flat.get((section, key), default)
+
+    def set(self, section, key, value):
+        self._flat[(section, key)] = value
 
     def __getitem__(self, section):
-        return self._config.get(section, {})
+        # rebuilt on demand; nothing on the hot path reads whole sections
+        return {k: v for (s, k), v in self._flat.items() if s == section}
 
 config = Config()
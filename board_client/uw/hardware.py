@@ -2,24 +2,30 @@ from uw.config import config
 
 MODEL = config.get("display", "model", "galactic").lower()
 
-if MODEL == "galactic":
-    from galactic import GalacticUnicorn as Unicorn
-    from picographics import PicoGraphics, DISPLAY_GALACTIC_UNICORN as DISPLAY
-    WIDTH, HEIGHT = 53, 11
-elif MODEL == "cosmic":
-    from cosmic import CosmicUnicorn as Unicorn
-    from picographics import PicoGraphics, DISPLAY_COSMIC_UNICORN as DISPLAY
-    WIDTH, HEIGHT = 32, 32
-elif MODEL == "stellar":
-    from stellar import StellarUnicorn as Unicorn
-    from picographics import PicoGraphics, DISPLAY_STELLAR_UNICORN as DISPLAY
-    WIDTH, HEIGHT = 16, 16
-else:
+# model -> (driver module, driver class, picographics display, width, height)
+_MODELS = {
+    "galactic": ("galactic", "GalacticUnicorn", "DISPLAY_GALACTIC_UNICORN", 53, 11),
+    "cosmic": ("cosmic", "CosmicUnicorn", "DISPLAY_COSMIC_UNICORN", 32, 32),
+    "stellar": ("stellar", "StellarUnicorn", "DISPLAY_STELLAR_UNICORN", 16, 16),
+}
+
+if MODEL not in _MODELS:
     raise RuntimeError(f"Unknown unicorn model: {MODEL}")
 
+# only the chosen board's driver is imported
+_driver, _cls, _display, WIDTH, HEIGHT = _MODELS[MODEL]
+Unicorn = getattr(__import__(_driver), _cls)
+import picographics
+PicoGraphics = picographics.PicoGraphics
+DISPLAY = getattr(picographics, _display)
+
 gu = Unicorn()
 graphics = PicoGraphics(DISPLAY)
 
+# shared pens for clearing and the crash screen, created once at import
+BLACK_PEN = graphics.create_pen(0, 0, 0)
+RED_PEN = graphics.create_pen(255, 0, 0)
+
 def set_brightness(level):
     # set the display brightness (0.0 to 1.0)
     gu.set_brightness(level)
@@ -3,6 +3,10 @@ import machine
 
 _debug_enabled = False
 _start_time = utime.ticks_ms()
+_rtc = machine.RTC()  # one instance, reused by every log line
+# last timestamp string and when it was built; bursts within a second reuse it
+_last_ts = None
+_last_ts_ms = 0
 
 def setup_logging(debug_enabled):
     global _debug_enabled
@@ -22,6 +26,8 @@ def log(msg, level="INFO", uptime=False):
 
 def format_uptime(ms):
     seconds = ms // 1000
+    if seconds < 60:
+        return f"{seconds}s"
     days = seconds // 86400
     hours = (seconds % 86400) // 3600
     minutes = (seconds % 3600) // 60
@@ -38,15 +44,22 @@ def format_uptime(ms):
     return " ".join(parts)
 
 def get_log_timestamp():
+    global _last_ts, _last_ts_ms
+    now = utime.ticks_ms()
+    if _last_ts is None or utime.ticks_diff(now, _last_ts_ms) >= 1000:
+        _last_ts = _build_log_timestamp()
+        _last_ts_ms = now
+    return _last_ts
+
+def _build_log_timestamp():
     try:
-        rtc = machine.RTC()
-        dt = rtc.datetime()
+        dt = _rtc.datetime()
         # if year is 2024 or earlier, rtc probably not set is a reasonable guess
         if dt[0] < 2025:
             raise ValueError
         # format as ISO8601 UTC
         # apply timezone offset
-        return "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}Z".format(
+        return "%04d-%02d-%02dT%02d:%02d:%02dZ" % (
             dt[0], dt[1], dt[2], dt[4], dt[5], dt[6]
         )
     except Exception:
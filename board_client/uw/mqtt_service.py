@@ -1,16 +1,78 @@
 import uasyncio
 import machine
 import uerrno
+import ujson
+import ustruct
+import micropython
 
 from uw.state import state
 from uw.logger import log
 from uw.config import config
 
+_RX_BUF_SIZE = micropython.const(256)  # covers control and typical text messages
+
 try:
-    from umqtt.simple import MQTTClient
+    from umqtt.simple import MQTTClient as _BaseMQTTClient
+
+    class MQTTClient(_BaseMQTTClient):
+        # umqtt.simple's wait_msg(), but each PUBLISH is read into one reusable
+        # buffer and handed to the callback as memoryviews rather than fresh
+        # bytes. Anything bigger than the buffer gets a one-off allocation
+        _rxbuf = None
+
+        def wait_msg(self):
+            res = self.sock.read(1)
+            self.sock.setblocking(True)
+            if res is None:
+                return None
+            if res == b"":
+                raise OSError(-1)
+            if res == b"\xd0":  # PINGRESP
+                self.sock.read(1)
+                return None
+            op = res[0]
+            if op & 0xF0 != 0x30:
+                return op
+            sz = self._recv_len()
+            if self._rxbuf is None:
+                self._rxbuf = bytearray(_RX_BUF_SIZE)
+            buf = self._rxbuf if sz <= _RX_BUF_SIZE else bytearray(sz)
+            mv = memoryview(buf)
+            self.sock.readinto(mv[:sz])
+            pos = 2 + ((buf[0] << 8) | buf[1])
+            topic = mv[2:pos]
+            if op & 6:
+                pid = (buf[pos] << 8) | buf[pos + 1]
+                pos += 2
+            self.cb(topic, mv[pos:sz])
+            if op & 6 == 2:
+                pkt = bytearray(b"\x40\x02\0\0")
+                ustruct.pack_into("!H", pkt, 2, pid)
+                self.sock.write(pkt)
+            elif op & 6 == 4:
+                assert 0
 except ImportError:
     MQTTClient = None
 
+# uasyncio's poller, used to sleep until the MQTT socket has data. It's
+# internal API, so fall back to timed polling if it isn't there
+try:
+    from uasyncio import core as _core
+    _has_io_queue = hasattr(_core, "_io_queue")
+except ImportError:
+    _has_io_queue = False
+
+_POLL_MS = micropython.const(100)  # fallback poll interval
+_STATUS_FLUSH_MS = micropython.const(250)  # status updates within this window go out together
+
+def _reset(_):
+    machine.reset()
+
+async def _readable(sock):
+    # suspend this task until sock is readable (same trick uasyncio's streams use).
+    # Look _io_queue up each time: new_event_loop() replaces it
+    yield _core._io_queue.queue_read(sock)
+
 class MQTTService:
     def __init__(self, status_callback=None):
         self.client = None
@@ -19,6 +81,26 @@ class MQTTService:
         self.connection_attempted = False
         self.disable_reconnect = False
         self.status_callback = status_callback  # Callback to update service status
+        self._status_topic = None
+        self._status_prefix = None  # b'{"client_id":"<id>","animation":"'
+        self._pending_status = None  # fields waiting for the next status flush
+        # subscribed topics, looked up once and kept as bytes so incoming topics
+        # from umqtt compare without decoding
+        self._topic_onoff = config.get("mqtt", "topic_on_off", "unicorn/control/onoff").encode()
+        self._topic_cmd = config.get("mqtt", "topic_cmd", "unicorn/control/cmd").encode()
+        self._topic_text = config.get("mqtt", "topic_text_message", "unicorn/message/text").encode()
+        self._rx = False  # set by _on_message so loop() knows a PUBLISH was read
+        # raw payload -> handler for the control topics, built once
+        self._onoff_handlers = {
+            b"ON": self._do_on,
+            b"OFF": self._do_off,
+            b"ONAIR": self._do_onair,
+            b"OFFAIR": self._do_offair,
+        }
+        self._cmd_handlers = {
+            b"NEXT": self._do_next,
+            b"RESET": self._do_reset,
+        }
 
     def connect(self):
         if not MQTTClient:
@@ -41,6 +123,9 @@ class MQTTService:
             self.client.sock.setblocking(False)
             self.connected = True
             self.client_id = client_id
+            # status topic and the fixed head of the animation status JSON
+            self._status_topic = config.get("mqtt", "topic_publish_status", "unicorn/status")
+            self._status_prefix = b'{"client_id":"' + client_id.encode() + b'","animation":"'
             log(f"Connected to MQTT broker at {broker}:{port}", "INFO")
             
             # Notify service manager that MQTT is connected but pending final confirmation
@@ -48,9 +133,9 @@ class MQTTService:
                 self.status_callback("mqtt", "connected_pending")
             
             # Subscribe to topics as needed
-            self.client.subscribe(config.get("mqtt", "topic_on_off", "unicorn/control/onoff"))
-            self.client.subscribe(config.get("mqtt", "topic_cmd", "unicorn/control/cmd"))
-            self.client.subscribe(config.get("mqtt", "topic_text_message", "unicorn/message/text"))
+            self.client.subscribe(self._topic_onoff)
+            self.client.subscribe(self._topic_cmd)
+            self.client.subscribe(self._topic_text)
             return True
         except Exception as e:
             log(f"MQTT connection failed: {e}", "WARN")
@@ -58,64 +143,80 @@ class MQTTService:
             return False
 
     def publish_status(self, status_dict):
-        """Publish a status update as JSON to the status topic."""
+        """Queue a status update; updates within _STATUS_FLUSH_MS are merged into one JSON publish.
+
+        Returns True once the update is queued, not when it is sent."""
         if not self.connected or not self.client:
             return False
-        import ujson
-        topic = config.get("mqtt", "topic_publish_status", "unicorn/status")
+        if self._pending_status is None:
+            # seeded with client_id, so the flush adds nothing to it
+            self._pending_status = {"client_id": self.client_id}
+            uasyncio.create_task(self._flush_status())
+        # later values for the same field replace earlier ones
+        self._pending_status.update(status_dict)
+        return True
+
+    async def _flush_status(self):
+        await uasyncio.sleep_ms(_STATUS_FLUSH_MS)
+        self._send_pending_status()
+
+    def _send_pending_status(self):
+        # publish queued status now; a no-op if it already went out
+        status = self._pending_status
+        if status is None:
+            return
+        self._pending_status = None
+        if not self.connected or not self.client:
+            return
+        topic = self._status_topic
         try:
-            status_dict["client_id"] = self.client_id
-            payload = ujson.dumps(status_dict)
+            payload = ujson.dumps(status)
             self.client.publish(topic, payload)
             log(f"Published status to {topic}: {payload}", "DEBUG")
+        except Exception as e:
+            log(f"Failed to publish status: {e} - continuing MQTT listening", "WARN")
+
+    def publish_animation(self, animation_name):
+        """Publish the starting animation's name to the status topic."""
+        if not self.connected or not self.client:
+            return False
+        # queued status from the previous animation goes first, so the topic
+        # ends on this animation
+        self._send_pending_status()
+        try:
+            # splice the name into the prebuilt JSON; no dict, no ujson
+            payload = self._status_prefix + animation_name.encode() + b'"}'
+            self.client.publish(self._status_topic, payload)
+            log(f"Published status to {self._status_topic}: {payload}", "DEBUG")
             return True
         except Exception as e:
             log(f"Failed to publish status: {e} - continuing MQTT listening", "WARN")
             return False
 
     def _on_message(self, topic, msg):
-        topic = topic.decode() if isinstance(topic, bytes) else topic
-        msg = msg.decode() if isinstance(msg, bytes) else msg
-        log(f"MQTT Rx: {topic} = {msg}", "DEBUG")
+        self._rx = True
+        # topic and msg are views into the client's receive buffer, only valid
+        # during this call. Topics compare in place; control payloads are copied
+        # (a few bytes) for the dict lookup and the text payload is decoded
+        log(f"MQTT Rx: {bytes(topic)} ({len(msg)} bytes)", "DEBUG")
         # Handle ON/OFF, NEXT and text message
-        if topic == config.get("mqtt", "topic_on_off", "unicorn/control/onoff"):
-            if msg == "ON":
-                log("Display on from MQTT", "INFO")
-                state.display_on = True
-                state.interrupt_event.set()
-            elif msg == "OFF":
-                log("Display off from MQTT", "INFO")
-                state.display_on = False
-                state.interrupt_event.set()
-            elif msg == "ONAIR":
-                log("ON AIR from MQTT", "INFO")
-                state.display_on = True
-                state.next_animation = "onair"
-                state.interrupt_event.set()
-            elif msg == "OFFAIR":
-                log("OFF AIR from MQTT, releasing lock if set", "INFO")
-                state.display_on = True
-                state.next_animation = None
-                state.interrupt_event.set()
-        elif topic == config.get("mqtt", "topic_cmd", "unicorn/control/cmd"):
-            if msg == "NEXT":
-                # release lock if set
-                state.next_animation = None
-                state.interrupt_event.set()
-            elif msg == "RESET":
-                machine.reset()
-
-        elif topic == config.get("mqtt", "topic_text_message", "unicorn/message/text"):
-            if msg:
-                import ujson
+        if self._topic_onoff == topic:
+            handler = self._onoff_handlers.get(bytes(msg))
+            if handler:
+                handler()
+        elif self._topic_cmd == topic:
+            handler = self._cmd_handlers.get(bytes(msg))
+            if handler:
+                handler()
+        elif self._topic_text == topic:
+            if len(msg):
+                msg = str(msg, "utf-8")
+                # JSON {"text": ..., "repeat": n}, else plain text; ujson rejects
+                # plain text at its first character
                 try:
-                    if msg.startswith('{') and msg.endswith('}'):
-                        data = ujson.loads(msg)
-                        text = data.get("text", "")
-                        repeat = int(data.get("repeat", 1))
-                    else:
-                        text = msg
-                        repeat = 1
+                    data = ujson.loads(msg)
+                    text = data.get("text", "")
+                    repeat = int(data.get("repeat", 1))
                 except Exception:
                     text = msg
                     repeat = 1
@@ -123,11 +224,50 @@ class MQTTService:
                 state.text_repeat_count = max(1, repeat)
                 state.interrupt_event.set()
 
+    def _do_on(self):
+        log("Display on from MQTT", "INFO")
+        state.display_on = True
+        state.interrupt_event.set()
+
+    def _do_off(self):
+        log("Display off from MQTT", "INFO")
+        state.display_on = False
+        state.interrupt_event.set()
+
+    def _do_onair(self):
+        log("ON AIR from MQTT", "INFO")
+        state.display_on = True
+        state.next_animation = "onair"
+        state.interrupt_event.set()
+
+    def _do_offair(self):
+        log("OFF AIR from MQTT, releasing lock if set", "INFO")
+        state.display_on = True
+        state.next_animation = None
+        state.interrupt_event.set()
+
+    def _do_next(self):
+        # release lock if set
+        state.next_animation = None
+        state.interrupt_event.set()
+
+    def _do_reset(self):
+        # defer until the callback (and umqtt's parse) has unwound
+        log("Reset requested over MQTT", "INFO")
+        micropython.schedule(_reset, 0)
+
     async def loop(self):
         """Message handling loop - only runs after successful connection"""
         while self.connected:
             try:
-                self.client.check_msg()
+                # drain everything queued before sleeping. umqtt's check_msg()
+                # returns None both when idle and after handling a PUBLISH, so
+                # _rx tells the two apart
+                while True:
+                    self._rx = False
+                    if self.client.check_msg() is None and not self._rx:
+                        break
+                    await uasyncio.sleep_ms(0)
             except OSError as e:
                 if e.args[0] == uerrno.EAGAIN:
                     pass # No data available right now, check again later.
@@ -143,6 +283,9 @@ class MQTTService:
                 self.disable_reconnect = True  # Never try to reconnect
                 break
                     
-            await uasyncio.sleep_ms(100)
+            if _has_io_queue:
+                await _readable(self.client.sock)
+            else:
+                await uasyncio.sleep_ms(_POLL_MS)
         
         log("MQTT message loop ended", "INFO")
@@ -1,7 +1,8 @@
 import uasyncio
+import random
 from uw.config import config
 from uw.logger import log
-from uw.hardware import graphics, gu
+from uw.hardware import graphics, gu, WIDTH, HEIGHT, BLACK_PEN, RED_PEN
 from uw.state import state
 from uw.wifi_service import connect_wifi
 from uw.time_service import set_rtc_from_ntp, periodic_ntp_sync
@@ -24,6 +25,31 @@ service_status = {
     "streaming": STATUS_OFF,
 }
 
+# Startup grid: a 5x5 block centred on the display, one 2x2 quadrant per service
+# around a centre pixel. Pens are created once here rather than on every redraw
+_GRID_X0 = (WIDTH - 5) // 2
+_GRID_Y0 = (HEIGHT - 5) // 2
+# (service, x, y) of each quadrant's top-left pixel
+_GRID_QUADRANTS = tuple(
+    (key, _GRID_X0 + dx, _GRID_Y0 + dy)
+    for key, dx, dy in (("wifi", 0, 0), ("ntp", 3, 0), ("mqtt", 0, 3), ("streaming", 3, 3)))
+
+_STATUS_PENS = {
+    STATUS_ON: graphics.create_pen(0, 255, 0),  # Green
+    STATUS_FAIL: RED_PEN,  # Red
+    STATUS_CONNECTING: graphics.create_pen(255, 255, 0),  # Yellow
+    STATUS_CONNECTED_PENDING: graphics.create_pen(0, 255, 255),  # Cyan - connected but pending final confirmation
+    STATUS_ENABLED: graphics.create_pen(0, 0, 255),  # Blue
+}
+_PEN_OFF = graphics.create_pen(128, 128, 128)  # Grey
+_PEN_CENTRE = graphics.create_pen(200, 200, 200)
+_last_drawn = None  # statuses shown by the last draw_startup_grid()
+
+# connection settings used on every retry; config is fixed once loaded
+_NTP_HOST = config.get("general", "ntp_host", "pool.ntp.org")
+_STREAM_HOST = config.get("streaming", "host", "127.0.0.1")
+_STREAM_PORT = config.get("streaming", "port", 8000)
+
 # Track startup phase to prevent grid updates during normal operation
 startup_complete = False
 mqtt_connection_attempted = False
@@ -48,49 +74,36 @@ def mark_streaming_working():
         service_status["streaming"] = STATUS_ON
         log("Streaming confirmed working by animation - stopping background retries", "INFO")
 
-def draw_startup_grid():
-    WIDTH, HEIGHT = graphics.get_bounds()
-
-    def get_colour(status):
-        if status == STATUS_ON:
-            return (0, 255, 0)  # Green
-        elif status == STATUS_FAIL:
-            return (255, 0, 0)  # Red
-        elif status == STATUS_CONNECTING:
-            return (255, 255, 0)  # Yellow
-        elif status == STATUS_CONNECTED_PENDING:
-            return (0, 255, 255)  # Cyan - connected but pending final confirmation
-        elif status == STATUS_ENABLED:
-            return (0, 0, 255)  # Blue
-        else:  # off
-            return (128, 128, 128)  # Grey
-
-    grid_w, grid_h = 5, 5
-    x0 = (WIDTH - grid_w) // 2
-    y0 = (HEIGHT - grid_h) // 2
-
-    quadrants = {
-        "wifi":      [(0, 0), (1, 0), (0, 1), (1, 1)],
-        "ntp":       [(3, 0), (4, 0), (3, 1), (4, 1)],
-        "mqtt":      [(0, 3), (1, 3), (0, 4), (1, 4)],
-        "streaming": [(3, 3), (4, 3), (3, 4), (4, 4)],
-    }
+def draw_startup_grid(force=False):
+    # skip the redraw and gu.update() if no status has changed since last time
+    global _last_drawn
+    snapshot = (service_status["wifi"], service_status["ntp"],
+                service_status["mqtt"], service_status["streaming"])
+    if snapshot == _last_drawn and not force:
+        return
+    _last_drawn = snapshot
 
-    for key, status in service_status.items():
-        colour = get_colour(status)
-        pen = graphics.create_pen(colour[0], colour[1], colour[2])
-        graphics.set_pen(pen)
-        for pos in quadrants[key]:
-            graphics.pixel(x0 + pos[0], y0 + pos[1])
+    pens = _STATUS_PENS
+    for key, x, y in _GRID_QUADRANTS:
+        graphics.set_pen(pens.get(service_status[key], _PEN_OFF))
+        graphics.rectangle(x, y, 2, 2)
 
-    graphics.set_pen(graphics.create_pen(200, 200, 200))
-    graphics.pixel(x0 + 2, y0 + 2)
+    graphics.set_pen(_PEN_CENTRE)
+    graphics.pixel(_GRID_X0 + 2, _GRID_Y0 + 2)
 
     gu.update(graphics)
 
+def _retry_delay(section, attempt):
+    # exponential backoff plus up to jitter_s of jitter, so boards sharing a
+    # broker don't all retry in lockstep after an outage
+    base = config.get(section, "retry_base_s", 2)
+    cap = config.get(section, "retry_max_s", 300)
+    jitter = config.get(section, "jitter_s", 5)
+    return min(cap, base * (1 << min(attempt, 8))) + random.getrandbits(8) % (jitter + 1)
+
 async def _retry_service(service_name, connect_func, *args):
     global startup_complete, streaming_actually_working
-    retry_interval = config.get(service_name, "retry_interval_s", 45)
+    attempt = 0
     while True:
         # For streaming service, stop retrying if streaming is actually working
         if service_name == "streaming" and streaming_actually_working:
@@ -111,11 +124,13 @@ async def _retry_service(service_name, connect_func, *args):
                     draw_startup_grid()
                 break
             else:
-                log(f"{service_name} connection failed. Retrying in {retry_interval}s.", "WARN")
-                await uasyncio.sleep(retry_interval)
+                delay = _retry_delay(service_name, attempt)
+                log(f"{service_name} connection failed. Retrying in {delay}s.", "WARN")
         except Exception as e:
-            log(f"{service_name} connection failed: {e}. Retrying in {retry_interval}s.", "WARN")
-            await uasyncio.sleep(retry_interval)
+            delay = _retry_delay(service_name, attempt)
+            log(f"{service_name} connection failed: {e}. Retrying in {delay}s.", "WARN")
+        attempt += 1
+        await uasyncio.sleep(delay)
 
 async def initialise_services():
     global startup_complete
@@ -123,7 +138,7 @@ async def initialise_services():
     start_time = time.ticks_ms()
     
     # Clear the screen initially
-    graphics.set_pen(graphics.create_pen(0, 0, 0))
+    graphics.set_pen(BLACK_PEN)
     graphics.clear()
 
     # Set initial status based on config
@@ -136,7 +151,7 @@ async def initialise_services():
     if config.get("streaming", "enable", False):
         service_status["streaming"] = STATUS_ENABLED
     
-    draw_startup_grid()
+    draw_startup_grid(force=True)  # the screen was just cleared
     await uasyncio.sleep_ms(300)  # Brief initial display
 
     # --- WiFi with timeout ---
@@ -165,18 +180,16 @@ async def initialise_services():
         draw_startup_grid()
         await uasyncio.sleep_ms(200)  # Show WiFi result
 
-    # --- Sequential service attempts during startup phase ---
-    # Order: WiFi (already done), NTP, Streaming, then MQTT last
-    
-    # Start NTP sync
+    # --- Service attempts during startup phase ---
+    # NTP and the streaming check run together once WiFi is done; MQTT goes last
+    # as its connect() blocks
+    checks = []
     if config.get("general", "ntp_enable", True):
-        await _startup_ntp_sync()
-        draw_startup_grid()
-        await uasyncio.sleep_ms(100)  # Brief delay to show status
-    
-    # Start streaming connection check
+        checks.append(_startup_ntp_sync())
     if config.get("streaming", "enable", False):
-        await _startup_streaming_connect()
+        checks.append(_startup_streaming_connect())
+    if checks:
+        await uasyncio.gather(*checks)
         draw_startup_grid()
         await uasyncio.sleep_ms(100)  # Brief delay to show status
     
@@ -202,13 +215,14 @@ async def initialise_services():
     
     # Clear the screen and proceed to animations
     log("Clearing screen and completing startup", "DEBUG")
-    graphics.set_pen(graphics.create_pen(0, 0, 0))
+    graphics.set_pen(BLACK_PEN)
     graphics.clear()
     gu.update(graphics)
     log("Startup sequence completed successfully", "INFO")
 
 async def _background_wifi_connect():
     """Background WiFi connection with retries"""
+    attempt = 0
     while not state.wifi_connected:
         try:
             if await connect_wifi():
@@ -223,7 +237,8 @@ async def _background_wifi_connect():
             log(f"Background WiFi connection failed: {e}", "WARN")
             
         service_status["wifi"] = STATUS_FAIL
-        await uasyncio.sleep(45)  # Retry every 45 seconds
+        await uasyncio.sleep(_retry_delay("wifi", attempt))
+        attempt += 1
 
 async def _trigger_background_services():
     """Trigger background services when WiFi connects late"""
@@ -260,7 +275,7 @@ async def _startup_ntp_sync():
     await uasyncio.sleep_ms(200)
     
     try:
-        if set_rtc_from_ntp(config.get("general", "ntp_host", "pool.ntp.org")):
+        if set_rtc_from_ntp(_NTP_HOST):
             service_status["ntp"] = STATUS_ON
             uasyncio.create_task(periodic_ntp_sync())
             log("NTP sync successful during startup", "INFO")
@@ -276,14 +291,11 @@ async def _startup_ntp_sync():
 
 async def _background_ntp_sync():
     """Background NTP sync - waits for WiFi"""
-    # Wait for WiFi connection
-    while not state.wifi_connected:
-        await uasyncio.sleep(1)
+    await state.wifi_ready_event.wait()
     
     # Retry NTP sync
     async def ntp_retry_wrapper():
-        host = config.get("general", "ntp_host", "pool.ntp.org")
-        return set_rtc_from_ntp(host)
+        return set_rtc_from_ntp(_NTP_HOST)
     
     uasyncio.create_task(_retry_service("ntp", ntp_retry_wrapper))
 
@@ -343,8 +355,7 @@ async def _background_mqtt_retry():
     while not mqtt_ever_connected:
         # Wait for WiFi if not connected
         if not state.wifi_connected:
-            await uasyncio.sleep(1)
-            continue
+            await state.wifi_ready_event.wait()
             
         log("Retrying MQTT connection...", "INFO")
         service_status["mqtt"] = STATUS_CONNECTING
@@ -399,9 +410,6 @@ async def _startup_streaming_connect():
         service_status["streaming"] = STATUS_OFF
         return
     
-    host = config.get("streaming", "host", "127.0.0.1")
-    port = config.get("streaming", "port", 8000)
-    
     service_status["streaming"] = STATUS_CONNECTING
     draw_startup_grid()
     
@@ -411,7 +419,7 @@ async def _startup_streaming_connect():
     try:
         # Slightly longer timeout to avoid race conditions
         reader, writer = await uasyncio.wait_for(
-            uasyncio.open_connection(host, port), 1.2
+            uasyncio.open_connection(_STREAM_HOST, _STREAM_PORT), 1.2
         )
         writer.close()
         await writer.wait_closed()
@@ -426,14 +434,11 @@ async def _startup_streaming_connect():
 
 async def _background_streaming_connect():
     """Background streaming connection check"""
-    host = config.get("streaming", "host", "127.0.0.1")
-    port = config.get("streaming", "port", 8000)
-        
     # Retry streaming connection
     async def check_streaming():
         try:
             reader, writer = await uasyncio.wait_for(
-                uasyncio.open_connection(host, port), 2.0
+                uasyncio.open_connection(_STREAM_HOST, _STREAM_PORT), 2.0
             )
             writer.close()
             await writer.wait_closed()
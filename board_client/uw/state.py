@@ -4,6 +4,10 @@ class State:
     def __init__(self):
         self.animation_active = False
         self.streaming_active = False
+        self.stream_current_name = None
+        self.stream_frames_rendered = 0
+        self.stream_total_frames = 0
+        self.display_on_event = uasyncio.Event()  # set while the display is on
         self.display_on = True
         self.interrupt_event = uasyncio.Event()
         self.text_message = None
@@ -11,8 +15,36 @@ class State:
         self.text_repeat_count = 1
         self.text_scrolling_active = False
         self.transition_mode = None
+        self.wifi_ready_event = uasyncio.Event()  # set while WiFi is connected
         self.wifi_connected = False
         self.mqtt_connected = False
         self.mqtt_service = None
 
+    # display_on keeps display_on_event in step, so the main loop can wait on
+    # the event rather than polling the flag
+    @property
+    def display_on(self):
+        return self._display_on
+
+    @display_on.setter
+    def display_on(self, on):
+        self._display_on = on
+        if on:
+            self.display_on_event.set()
+        else:
+            self.display_on_event.clear()
+
+    # likewise for wifi_connected, so services can wait for the network
+    @property
+    def wifi_connected(self):
+        return self._wifi_connected
+
+    @wifi_connected.setter
+    def wifi_connected(self, connected):
+        self._wifi_connected = connected
+        if connected:
+            self.wifi_ready_event.set()
+        else:
+            self.wifi_ready_event.clear()
+
 state = State()